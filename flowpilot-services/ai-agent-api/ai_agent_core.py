@@ -14,74 +14,217 @@
 
 from __future__ import annotations
 
-import json
-import uuid
+import re
+import secrets
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple
+from urllib.parse import urlencode
 
 import requests
+import security
 from utils import (
+    HTTP_POOL_MAXSIZE,
+    HttpNon2xxError,
+    TTLCache,
     build_timeouts,
     build_url,
     get_http_config,
     http_get_json,
     http_post_json,
+    json_loads,
+    read_env_int,
     require_non_empty_string,
 )
 
+# Short-lived caches for workflow metadata and workflow-level authz decisions.
+# Re-running the same workflow as the same principal within the TTL skips the
+# GET /v1/workflows/{id} and POST /v1/evaluate round-trips.
+_AGENT_CACHE_SIZE = read_env_int("AGENT_CACHE_SIZE", 2048)
+_AGENT_CACHE_TTL_SECONDS = read_env_int("AGENT_CACHE_TTL_SECONDS", 30)
+_WF_META_CACHE = TTLCache(maxsize=_AGENT_CACHE_SIZE, ttl_seconds=_AGENT_CACHE_TTL_SECONDS)
+_AUTHZ_CACHE = TTLCache(maxsize=_AGENT_CACHE_SIZE, ttl_seconds=_AGENT_CACHE_TTL_SECONDS)
+
+# AuthZ reason codes that signal infrastructure trouble rather than a policy
+# outcome - decisions carrying these are never cached.
+_TRANSIENT_REASON_CODES = frozenset(
+    {"authz.system_error", "authz.persona_fetch_failed"}
+)
 
-@dataclass(frozen=True)
-class WorkflowItem:
+# Process-wide worker pool for per-item execution. Shared across runs so
+# concurrent requests are bounded together instead of each spawning threads.
+# Capped at HTTP_POOL_MAXSIZE so every worker can hold its own keep-alive
+# connection to the domain service (no throwaway connections beyond the pool).
+_ITEM_WORKERS = min(read_env_int("FLOWPILOT_ITEM_WORKERS", 8), HTTP_POOL_MAXSIZE)
+_ITEM_POOL = ThreadPoolExecutor(max_workers=_ITEM_WORKERS, thread_name_prefix="wf-item")
+
+
+def _map_on_item_pool(
+    fn: Callable[[Any], Any], items: Iterable[Any], max_in_flight: int
+) -> Iterator[Any]:
+    # Like _ITEM_POOL.map, but with at most max_in_flight calls submitted and unfinished at
+    # any time (a semaphore slot is taken before each submit and freed when the call ends).
+    # why: the pool is shared by all runs, so its size alone cannot bound a single run.
+    # assumptions: called from a thread outside _ITEM_POOL (blocking on a slot from a pool
+    # thread could starve the pool).
+    # side effects: like Executor.map, results (and exceptions) are yielded in input order.
+    slots = threading.BoundedSemaphore(max_in_flight)
+
+    def release_slot(_future: Future) -> None:
+        slots.release()
+
+    futures: list[Future] = []
+    for item in items:
+        slots.acquire()
+        future = _ITEM_POOL.submit(fn, item)
+        future.add_done_callback(release_slot)
+        futures.append(future)
+    return (future.result() for future in futures)
+
+
+# Deny bodies carry reason codes as "... reason_codes=['a.b', 'c.d'] ..."
+_REASON_CODES_RE = re.compile(r"reason_codes=\[([^\]]*)\]")
+_REASON_CODE_TOKEN_RE = re.compile(r"[\s'\"]*([^,'\"\s]+)[\s'\"]*")
+
+
+def clear_caches() -> None:
+    # Drop all cached workflow metadata and authz decisions (tests, config changes).
+    _WF_META_CACHE.clear()
+    _AUTHZ_CACHE.clear()
+    _build_authz_body.cache_clear()
+
+
+class WorkflowItem(NamedTuple):
+    # Tuple-backed (no per-instance __dict__); immutable like the former frozen dataclass.
     workflow_item_id: str
     kind: str
     raw: dict[str, Any]
 
 
+def _make_workflow_item(item: Any) -> WorkflowItem | None:
+    # Build a WorkflowItem from a raw item dict, or None when it has no usable id
+    # assumption: the workflow service may name the id item_id, workflow_item_id or itinerary_item_id.
+    if not isinstance(item, dict):
+        return None
+    item_id = (
+        item.get("item_id")
+        or item.get("workflow_item_id")
+        or item.get("itinerary_item_id")
+    )
+    if not isinstance(item_id, str):
+        return None
+    item_id = item_id.strip()
+    if not item_id:
+        return None
+    return WorkflowItem(item_id, str(item.get("kind") or "unknown"), item)
+
+
+@dataclass(frozen=True)
+class CompiledEndpoints:
+    # Per-config URL templates and settings, validated and joined once.
+    # URL templates keep str.format placeholders ({workflow_id}, {workflow_item_id}).
+    workflow_base_url: str
+    authz_evaluate_url: str
+    workflow_items_url_template: str
+    workflow_item_execute_url_template: str
+    workflow_url_template: str
+    timeout_seconds: int
+    timeouts: tuple[float, float]
+
+
+@lru_cache(maxsize=16)
+def _compile_endpoints(
+    workflow_base_url: str,
+    authz_base_url: str,
+    workflow_items_path_template: str,
+    workflow_item_execute_path_template: str,
+    timeout_seconds: int,
+) -> CompiledEndpoints:
+    # Validate config values and pre-join path templates onto their base URLs
+    # why: config never changes within a process, so do this once instead of per item.
+    workflow_base_url = require_non_empty_string(workflow_base_url, "workflow_base_url")
+    authz_base_url = require_non_empty_string(authz_base_url, "authz_base_url")
+    items_template = require_non_empty_string(
+        workflow_items_path_template, "workflow_items_path_template"
+    )
+    execute_template = require_non_empty_string(
+        workflow_item_execute_path_template, "workflow_item_execute_path_template"
+    )
+    return CompiledEndpoints(
+        workflow_base_url=workflow_base_url,
+        authz_evaluate_url=build_url(authz_base_url, "/v1/evaluate"),
+        workflow_items_url_template=build_url(workflow_base_url, items_template),
+        workflow_item_execute_url_template=build_url(workflow_base_url, execute_template),
+        workflow_url_template=build_url(workflow_base_url, "/v1/workflows/{workflow_id}"),
+        timeout_seconds=int(timeout_seconds),
+        timeouts=build_timeouts(connect_seconds=int(timeout_seconds)),
+    )
+
+
+def compiled_endpoints(config: Mapping[str, Any]) -> CompiledEndpoints:
+    # Return the compiled endpoints for a config (memoized on the config values).
+    return _compile_endpoints(
+        str(config.get("workflow_base_url", "")),
+        str(config.get("authz_base_url", "")),
+        str(config.get("workflow_items_path_template", "")),
+        str(config.get("workflow_item_execute_path_template", "")),
+        int(config.get("request_timeout_seconds", 10)),
+    )
+
+
 def normalize_workflow_id(workflow_id: str) -> str:
     # Normalize workflow_id
     # why: keep validation centralized
-    if workflow_id and isinstance(workflow_id, str) and workflow_id.strip():
-        return workflow_id.strip()
-    raise ValueError("Missing workflow_id")
+    normalized = workflow_id.strip() if isinstance(workflow_id, str) else ""
+    if not normalized:
+        raise ValueError("Missing workflow_id")
+    return normalized
 
 
 def list_workflow_items(
-    config: dict[str, Any],
+    config: Mapping[str, Any],
     workflow_id: str,
     principal_user_id: str = None,
     principal_persona_title: str = None,
     principal_persona_circle: str = None,
     user_token: str = None,
+    session: requests.Session | None = None,
+    timeout_seconds: int | None = None,
 ) -> list[WorkflowItem]:
     # List workflow items from the workflow service
     # assumption: response contains an 'items' list of dicts.
     # principal_user_id: user's UUID for authorization (passed as query parameter)
     # principal_persona_title: user's persona title for authorization (passed as query parameter)
     # principal_persona_circle: user's persona circle for authorization (passed as query parameter)
+    # session: optional requests session (defaults to the pooled session in utils)
+    # timeout_seconds: optional pre-resolved timeout (defaults to the config value)
     require_non_empty_string(workflow_id, "workflow_id")
 
-    base_url = require_non_empty_string(
-        str(config.get("workflow_base_url", "")), "workflow_base_url"
-    )
-    template = require_non_empty_string(
-        str(config.get("workflow_items_path_template", "")),
-        "workflow_items_path_template",
-    )
-    timeout_seconds = int(config.get("request_timeout_seconds", 10))
+    endpoints = compiled_endpoints(config)
+    if timeout_seconds is None:
+        timeout_seconds = endpoints.timeout_seconds
 
     # Build URL with user_sub, persona_title, and persona_circle query parameters if provided
-    base_url_with_path = build_url(base_url, template.format(workflow_id=workflow_id))
-    query_params = []
-    if principal_user_id:
-        query_params.append(f"user_sub={principal_user_id}")
-    if principal_persona_title:
-        query_params.append(f"persona_title={principal_persona_title}")
-    if principal_persona_circle:
-        query_params.append(f"persona_circle={principal_persona_circle}")
+    base_url_with_path = endpoints.workflow_items_url_template.format(
+        workflow_id=workflow_id
+    )
+    query_params = {
+        name: value
+        for name, value in (
+            ("user_sub", principal_user_id),
+            ("persona_title", principal_persona_title),
+            ("persona_circle", principal_persona_circle),
+        )
+        if value
+    }
 
     if query_params:
+        # urlencode so spaces, '+', '&' and non-ASCII in persona values survive the round-trip
         separator = "&" if "?" in base_url_with_path else "?"
-        url = f"{base_url_with_path}{separator}{'&'.join(query_params)}"
+        url = f"{base_url_with_path}{separator}{urlencode(query_params)}"
     else:
         url = base_url_with_path
 
@@ -93,104 +236,87 @@ def list_workflow_items(
         raise ValueError("User token is required for service-to-service calls")
 
     payload = http_get_json(
-        url=url, timeout_seconds=timeout_seconds, headers=headers if headers else None
+        url=url,
+        timeout_seconds=timeout_seconds,
+        headers=headers if headers else None,
+        session=session,
     )
 
     items_raw = payload.get("items", [])
     if not isinstance(items_raw, list):
         raise ValueError("Workflow items response malformed: items must be a list")
 
-    items: list[WorkflowItem] = []
-    for item in items_raw:
-        if not isinstance(item, dict):
-            continue
-        item_id = (
-            item.get("item_id")
-            or item.get("workflow_item_id")
-            or item.get("itinerary_item_id")
-        )
-        kind = item.get("kind") or "unknown"
-        if isinstance(item_id, str) and item_id.strip():
-            items.append(
-                WorkflowItem(workflow_item_id=item_id.strip(), kind=str(kind), raw=item)
-            )
+    items: list[WorkflowItem] = [
+        workflow_item
+        for workflow_item in map(_make_workflow_item, items_raw)
+        if workflow_item is not None
+    ]
 
     return items
 
 
-def parse_policy_deny_from_body(response_text: str) -> tuple[list[str], str]:
+def parse_policy_deny_from_body(
+    response_text: str, detail: str | None = None
+) -> tuple[list[str], str]:
     # Parse deny reason codes from FlowPilot/AuthZ error bodies
     # Returns (reason_codes, message) tuple
+    # detail: already-parsed string 'detail' of a JSON body; skips re-parsing the JSON
     reason_codes: list[str] = []
     message: str = response_text.strip()
 
-    # Try to parse as JSON
-    if response_text.strip().startswith("{"):
-        parsed = json.loads(response_text)
+    if detail is not None:
+        if detail.strip() != "":
+            message = detail.strip()
+    elif message.startswith("{"):
+        # Try to parse as JSON
+        parsed = json_loads(message)
         if isinstance(parsed, dict):
             detail = parsed.get("detail")
             if isinstance(detail, str) and detail.strip() != "":
                 message = detail.strip()
 
-    # Extract reason codes from message
-    if "reason_codes" in message:
-        start = message.find("reason_codes=")
-        if start >= 0:
-            fragment = message[start:]
-            left = fragment.find("[")
-            right = fragment.find("]")
-            if left >= 0 and right > left:
-                content = fragment[left + 1 : right]
-                reason_codes = [
-                    part.strip().strip("'\"")
-                    for part in content.split(",")
-                    if part.strip() != ""
-                ]
-
-    if not reason_codes:
-        if "***REMOVED***.deny" in message:
-            reason_codes = ["***REMOVED***.deny"]
+    # Extract reason codes from message in a single regex scan
+    match = _REASON_CODES_RE.search(message)
+    if match:
+        reason_codes = _REASON_CODE_TOKEN_RE.findall(match.group(1))
+
+    if not reason_codes and "***REMOVED***.deny" in message:
+        reason_codes = ["***REMOVED***.deny"]
 
     return reason_codes, message
 
 
-def _call_authz_for_workflow(
-    config: dict[str, Any],
-    workflow: dict[str, Any],
-    principal_user: dict[str, Any],
+# Value types _build_authz_body can take as lru_cache keys
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=4096)
+def _build_authz_body(
+    workflow_id: str,
+    workflow_domain: Any,
+    owner_sub: str,
+    owner_persona_title: Any,
+    owner_persona_circle: Any,
+    departure_date: Any,
+    principal_items: tuple[tuple[str, Any], ...],
     agent_sub: str,
-    action: str = "execute",
-    user_token: str = None,
+    action: str,
 ) -> dict[str, Any]:
-    # Call AuthZ /v1/evaluate for workflow operations
-    # Handles workflow-level actions: create, read, update, delete, execute
-    # This follows the same pattern as domain-services-api for consistency
-    authz_base_url = require_non_empty_string(
-        str(config.get("authz_base_url", "")), "authz_base_url"
-    )
-    
-    # Extract workflow properties
-    workflow_id = str(workflow.get("workflow_id", ""))
-    workflow_domain = workflow.get("domain", "travel")
-    owner_sub = str(workflow.get("owner_sub", ""))
-    owner_persona_title = workflow.get("owner_persona_title")  # Get persona title from workflow
-    owner_persona_circle = workflow.get("owner_persona_circle")  # Get persona circle from workflow
-    departure_date = workflow.get("departure_date")
-    
-    # Validate that owner_persona_title is present (required for authz checks)
-    if not owner_persona_title:
-        raise ValueError(f"Workflow {workflow_id} is missing owner_persona_title - cannot perform authorization check")
-    
+    # Build the AuthZEN /v1/evaluate body for a workflow-level action
+    # why: the body is a pure function of workflow identity, principal, agent and action,
+    # so repeat checks reuse the same dict instead of rebuilding it.
+    # assumptions: only called with scalar arguments (see _call_authz_for_workflow); the
+    # returned dict and its nested dicts are shared, so callers copy before mutating.
     # Build resource properties
     resource_properties: dict[str, Any] = {
         "workflow_id": workflow_id,
         "domain": workflow_domain,
     }
-    
+
     # Add departure_date if available
     if departure_date:
         resource_properties["departure_date"] = departure_date
-    
+
     # Add owner to resource properties
     if owner_sub:
         owner_dict: dict[str, Any] = {"type": "user", "id": owner_sub}
@@ -199,43 +325,92 @@ def _call_authz_for_workflow(
         if owner_persona_circle:
             owner_dict["persona_circle"] = str(owner_persona_circle)
         resource_properties["owner"] = owner_dict
-    
-    # Build AuthZEN request
-    url = build_url(authz_base_url, "/v1/evaluate")
-    
+
     # AuthZEN: Build context with principal-user object
     context: dict[str, Any] = {
-        "principal": principal_user,
+        "principal": dict(principal_items),
         "policy_hint": workflow_domain,  # Dynamic policy selection based on domain
     }
-    
+
     # Subject is the agent making the call
     subject: dict[str, Any] = {
         "type": "agent",
         "id": agent_sub,
     }
-    
+
     # Build resource
     resource: dict[str, Any] = {
         "type": "workflow",
         "id": workflow_id,
         "properties": resource_properties,
     }
-    
+
     # Build options
     options: dict[str, Any] = {"explain": True, "metrics": False}
-    
-    body: dict[str, Any] = {
+
+    return {
         "subject": subject,
         "action": {"name": action},
         "resource": resource,
         "context": context,
         "options": options,
     }
+
+
+def _call_authz_for_workflow(
+    config: Mapping[str, Any],
+    workflow: dict[str, Any],
+    principal_user: dict[str, Any],
+    agent_sub: str,
+    action: str = "execute",
+    user_token: str = None,
+) -> dict[str, Any]:
+    # Call AuthZ /v1/evaluate for workflow operations
+    # Handles workflow-level actions: create, read, update, delete, execute
+    # This follows the same pattern as domain-services-api for consistency
+    endpoints = compiled_endpoints(config)
+
+    # Extract workflow properties
+    workflow_id = str(workflow.get("workflow_id", ""))
+    workflow_domain = workflow.get("domain", "travel")
+    owner_sub = str(workflow.get("owner_sub", ""))
+    owner_persona_title = workflow.get("owner_persona_title")  # Get persona title from workflow
+    owner_persona_circle = workflow.get("owner_persona_circle")  # Get persona circle from workflow
+    departure_date = workflow.get("departure_date")
     
+    # Validate that owner_persona_title is present (required for authz checks)
+    if not owner_persona_title:
+        raise ValueError(f"Workflow {workflow_id} is missing owner_persona_title - cannot perform authorization check")
+
+    body_args = (
+        workflow_id,
+        workflow_domain,
+        owner_sub,
+        owner_persona_title,
+        owner_persona_circle,
+        departure_date,
+        tuple(principal_user.items()),
+        agent_sub,
+        action,
+    )
+    # Memoize only when every value is a scalar; nested principal or workflow values
+    # (lists, dicts) are built without the cache.
+    scalar_values = (
+        workflow_domain,
+        owner_persona_title,
+        owner_persona_circle,
+        departure_date,
+        agent_sub,
+        action,
+        *principal_user.values(),
+    )
+    if all(isinstance(value, _SCALAR_TYPES) for value in scalar_values):
+        body = dict(_build_authz_body(*body_args))
+    else:
+        body = _build_authz_body.__wrapped__(*body_args)
+
     # Always use service token for authz-api calls (user identity is in context.principal)
     # This matches how domain-services-api calls authz-api
-    import security
     service_token = security.get_service_token()
     headers = {"Authorization": f"Bearer {service_token}"} if service_token else {}
     
@@ -245,15 +420,15 @@ def _call_authz_for_workflow(
     
     # Use centralized http_post_json for logging and error handling
     return http_post_json(
-        url=url,
+        url=endpoints.authz_evaluate_url,
         payload=body,
-        timeouts=build_timeouts(connect_seconds=int(config.get("request_timeout_seconds", 10))),
+        timeouts=endpoints.timeouts,
         headers=headers if headers else None,
     )
 
 
 def check_workflow_execution_authorization(
-    config: dict[str, Any],
+    config: Mapping[str, Any],
     workflow_id: str,
     principal_user: dict[str, Any],
     agent_sub: str,
@@ -270,31 +445,23 @@ def check_workflow_execution_authorization(
             "advice": [{"type": "error", "message": "Invalid principal_user object"}],
         }
 
-    # Basic validation: principal must have an ID
-    principal_id = principal_user.get("id", "").strip()
-    if not principal_id:
-        return {
-            "decision": "deny",
-            "reason_codes": ["missing_principal_id"],
-            "advice": [{"type": "error", "message": "Principal ID is required"}],
-        }
-    
-    principal_persona_title = principal_user.get("persona_title", "").strip()
-    if not principal_persona_title:
-        return {
-            "decision": "deny",
-            "reason_codes": ["missing_principal_persona_title"],
-            "advice": [{"type": "error", "message": "Principal persona title is required"}],
-        }
-    
-    principal_persona_circle = principal_user.get("persona_circle", "").strip()
-    if not principal_persona_circle:
-        return {
-            "decision": "deny",
-            "reason_codes": ["missing_principal_persona_circle"],
-            "advice": [{"type": "error", "message": "Principal persona circle is required"}],
-        }
-    
+    # Basic validation: principal must have an ID, persona title and persona circle
+    # (each value is stripped once and reused for the cache keys and query params below)
+    principal_id = str(principal_user.get("id") or "").strip()
+    principal_persona_title = str(principal_user.get("persona_title") or "").strip()
+    principal_persona_circle = str(principal_user.get("persona_circle") or "").strip()
+    for value, reason_code, message in (
+        (principal_id, "missing_principal_id", "Principal ID is required"),
+        (principal_persona_title, "missing_principal_persona_title", "Principal persona title is required"),
+        (principal_persona_circle, "missing_principal_persona_circle", "Principal persona circle is required"),
+    ):
+        if not value:
+            return {
+                "decision": "deny",
+                "reason_codes": [reason_code],
+                "advice": [{"type": "error", "message": message}],
+            }
+
     if not user_token:
         return {
             "decision": "deny",
@@ -303,10 +470,8 @@ def check_workflow_execution_authorization(
         }
     
     # Get workflow from domain-services to extract owner and domain
-    workflow_base_url = require_non_empty_string(
-        str(config.get("workflow_base_url", "")), "workflow_base_url"
-    )
-    workflow_url = build_url(workflow_base_url, f"/v1/workflows/{workflow_id}")
+    endpoints = compiled_endpoints(config)
+    workflow_url = endpoints.workflow_url_template.format(workflow_id=workflow_id)
     
     headers = {"Authorization": f"Bearer {user_token}"}
     
@@ -316,14 +481,37 @@ def check_workflow_execution_authorization(
         "persona_circle": principal_persona_circle,
     }
     
+    authz_cache_key = (
+        workflow_id,
+        principal_id,
+        principal_persona_title,
+        principal_persona_circle,
+        agent_sub,
+        "execute",
+    )
+    cached_decision = _AUTHZ_CACHE.get(authz_cache_key)
+    if cached_decision is not None:
+        return cached_decision
+
+    # Workflow metadata is fetched with the user's token, so the principal is part of the key
+    wf_meta_cache_key = (
+        workflow_id,
+        principal_id,
+        principal_persona_title,
+        principal_persona_circle,
+    )
+
     try:
         # Fetch workflow metadata
-        workflow = http_get_json(
-            url=workflow_url,
-            params=params,
-            timeout_seconds=int(config.get("request_timeout_seconds", 10)),
-            headers=headers,
-        )
+        workflow = _WF_META_CACHE.get(wf_meta_cache_key)
+        if workflow is None:
+            workflow = http_get_json(
+                url=workflow_url,
+                params=params,
+                timeout_seconds=endpoints.timeout_seconds,
+                headers=headers,
+            )
+            _WF_META_CACHE.set(wf_meta_cache_key, workflow)
         
         # Call authz-api using the shared helper function
         result = _call_authz_for_workflow(
@@ -335,11 +523,14 @@ def check_workflow_execution_authorization(
             user_token=user_token,
         )
         
-        return {
+        decision = {
             "decision": result.get("decision", "deny"),
             "reason_codes": result.get("reason_codes", []),
             "advice": result.get("advice", []),
         }
+        if _TRANSIENT_REASON_CODES.isdisjoint(decision["reason_codes"] or ()):
+            _AUTHZ_CACHE.set(authz_cache_key, decision)
+        return decision
     
     except RuntimeError as exc:
         # Authorization check failed - treat as deny
@@ -356,11 +547,12 @@ def post_execute_workflow_item(
     payload: dict[str, Any],
     timeouts: tuple[float, float],
     user_token: str = None,
+    session: requests.Session | None = None,
 ) -> tuple[int, dict[str, Any] | None, str]:
     # Call the domain execute endpoint and return status + parsed JSON when possible
     # why: distinguish policy deny (403) from execution errors
     # assumptions: JSON body on success and often on failure
-    # side effects: network I/O, automatic logging via http_post_json
+    # side effects: network I/O over the pooled session, automatic logging via http_post_json
     #
     # Note: This function wraps http_post_json to provide status code + text for 403 handling
     headers = {}
@@ -375,55 +567,37 @@ def post_execute_workflow_item(
             payload=payload,
             timeouts=timeouts,
             headers=headers if headers else None,
+            session=session,
         )
         # Success: return 200 with parsed JSON
         return 200, response_json, ""
+    except HttpNon2xxError as exc:
+        # http_post_json raised HttpNon2xxError for non-2xx response
+        return exc.status_code, _parse_json_object_or_none(exc.body_bytes), exc.body
     except RuntimeError as exc:
-        # http_post_json raised RuntimeError for non-2xx response
-        # Parse the error message to extract status code and body
-        error_str = str(exc)
-        
-        # Extract status code from error message: "HTTP POST non-2xx: url=... http=403 body=..."
-        status_code = 500  # Default to 500 if we can't parse
-        response_text = error_str
-        
-        if "http=" in error_str:
-            try:
-                # Extract status code
-                parts = error_str.split("http=")
-                if len(parts) > 1:
-                    status_part = parts[1].split()[0]
-                    status_code = int(status_part)
-                
-                # Extract body
-                if "body=" in error_str:
-                    body_parts = error_str.split("body=")
-                    if len(body_parts) > 1:
-                        response_text = body_parts[1]
-            except (ValueError, IndexError):
-                pass
-        
-        # Try to parse JSON from response text
-        parsed_json: dict[str, Any] | None = None
-        if response_text and response_text.strip().startswith("{"):
-            try:
-                import json
-                parsed_json = json.loads(response_text)
-                if not isinstance(parsed_json, dict):
-                    parsed_json = None
-            except (json.JSONDecodeError, ValueError):
-                pass
-        
-        return status_code, parsed_json, response_text
+        # Transport or invalid-JSON failure without a usable upstream status
+        return 500, None, str(exc)
+
+
+def _parse_json_object_or_none(body: bytes | str) -> dict[str, Any] | None:
+    # Parse an error body as a JSON object, returning None when it is not one.
+    if not body or not body.lstrip().startswith(b"{" if isinstance(body, bytes) else "{"):
+        return None
+    try:
+        parsed = json_loads(body)
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
 
 
 def execute_workflow_item(
-    config: dict[str, Any],
+    config: Mapping[str, Any],
     workflow_id: str,
     workflow_item_id: str,
     principal_user: dict[str, Any],
     dry_run: bool,
     user_token: str = None,
+    timeouts: tuple[float, float] | None = None,
 ) -> dict[str, Any]:
     # Execute a single workflow item via the domain service and classify policy denies (HTTP 403) as completed results
     # why: denies are valid authorization outcomes and must not be treated as execution failures
@@ -435,20 +609,12 @@ def execute_workflow_item(
     if not isinstance(principal_user, dict) or not principal_user.get("id"):
         raise ValueError("Invalid principal_user object")
 
-    base_url = require_non_empty_string(
-        str(config.get("workflow_base_url", "")), "workflow_base_url"
-    )
-    template = require_non_empty_string(
-        str(config.get("workflow_item_execute_path_template", "")),
-        "workflow_item_execute_path_template",
-    )
-
-    timeout_seconds = int(config.get("request_timeout_seconds", 10))
-    timeouts = build_timeouts(connect_seconds=timeout_seconds)
+    endpoints = compiled_endpoints(config)
+    if timeouts is None:
+        timeouts = endpoints.timeouts
 
-    url = build_url(
-        base_url,
-        template.format(workflow_id=workflow_id, workflow_item_id=workflow_item_id),
+    url = endpoints.workflow_item_execute_url_template.format(
+        workflow_id=workflow_id, workflow_item_id=workflow_item_id
     )
     # AuthZEN: Pass principal-user object instead of just principal_sub
     payload: dict[str, Any] = {
@@ -471,26 +637,20 @@ def execute_workflow_item(
         }
 
     if status_code == 403:
-        # Extract reason_codes from JSON response if available, otherwise parse from text
+        # Structured AuthZ deny: {"detail": {"reason_codes": [...], "advice": [...]}}
+        # fast path: the body is already parsed, take the fields directly
+        detail = response_json.get("detail") if isinstance(response_json, dict) else None
         reason_codes: list[str] = []
         advice: list[dict[str, Any]] = []
-        if response_json and isinstance(response_json, dict):
-            # Try to get reason_codes from detail object
-            detail = response_json.get("detail", {})
-            if isinstance(detail, dict):
-                reason_codes = list(detail.get("reason_codes", []) or [])
-                advice = list(detail.get("advice", []) or [])
-            elif isinstance(detail, str):
-                # Fallback: parse from string format
-                parsed_reason_codes, message = parse_policy_deny_from_body(
-                    response_text
-                )
-                reason_codes = parsed_reason_codes
-                if message:
-                    advice = [{"type": "deny", "message": message}]
-        else:
-            # Fallback: parse from text
-            parsed_reason_codes, message = parse_policy_deny_from_body(response_text)
+        if isinstance(detail, dict):
+            reason_codes = detail.get("reason_codes") or []
+            advice = detail.get("advice") or []
+        elif isinstance(detail, str) or not response_json:
+            # String detail or non-JSON body: parse reason codes out of the text
+            # (a string detail is passed in so the body is not decoded twice)
+            parsed_reason_codes, message = parse_policy_deny_from_body(
+                response_text, detail=detail
+            )
             reason_codes = parsed_reason_codes
             if message:
                 advice = [{"type": "deny", "message": message}]
@@ -521,12 +681,62 @@ def execute_workflow_item(
     }
 
 
+def _execute_run_item(
+    config: Mapping[str, Any],
+    workflow_id: str,
+    item: WorkflowItem,
+    principal_user: dict[str, Any],
+    dry_run: bool,
+    user_token: str = None,
+    timeouts: tuple[float, float] | None = None,
+) -> dict[str, Any]:
+    # Execute one workflow item and normalize the outcome into the run result schema
+    # why: keep per-item work self-contained so items can run concurrently
+    # side effects: network I/O.
+    try:
+        response = execute_workflow_item(
+            config=config,
+            workflow_id=workflow_id,
+            workflow_item_id=item.workflow_item_id,
+            principal_user=principal_user,
+            dry_run=dry_run,
+            user_token=user_token,
+            timeouts=timeouts,
+        )
+
+        status = str(response.get("status", "error"))
+        decision = str(response.get("outcome", response.get("decision", "unknown")))
+        # execute_workflow_item builds these lists fresh per call and never touches them again,
+        # so hand them through instead of copying
+        reason_codes = response.get("reason_codes") or []
+        advice = response.get("advice") or []
+
+        return {
+            "workflow_item_id": item.workflow_item_id,
+            "kind": item.kind,
+            "status": status,
+            "decision": decision,
+            "reason_codes": reason_codes,
+            "advice": advice,
+        }
+    except ValueError as exception:
+        return {
+            "workflow_item_id": item.workflow_item_id,
+            "kind": item.kind,
+            "status": "error",
+            "decision": "deny",
+            "reason_codes": ["agent_runner.item_execution_failed"],
+            "advice": [{"type": "error", "message": str(exception)}],
+        }
+
+
 def execute_workflow_run(
-    config: dict[str, Any],
+    config: Mapping[str, Any],
     workflow_id: str,
     principal_user: dict[str, Any],
     dry_run: bool,
     user_token: str = None,
+    agent_sub: str = "agent-runner",
 ) -> dict[str, Any]:
     # Execute a workflow by iterating items and delegating execution to domain endpoints,
     # normalizing each item result into a stable schema
@@ -539,10 +749,37 @@ def execute_workflow_run(
     if not isinstance(principal_user, dict) or not principal_user.get("id"):
         raise ValueError("Invalid principal_user object")
 
-    run_id = "wr_" + uuid.uuid4().hex[:10]
+    run_id = "wr_" + secrets.token_hex(5)
+    # Resolve timeouts once per run instead of once per item call
+    endpoints = compiled_endpoints(config)
+
+    # Workflow-level gate: a deny here short-circuits the item listing and every item call
+    authz_result = check_workflow_execution_authorization(
+        config=config,
+        workflow_id=workflow_id,
+        principal_user=principal_user,
+        agent_sub=agent_sub,
+        user_token=user_token,
+    )
+    if authz_result.get("decision") != "allow":
+        # Return structured denial with reason codes so the client can see WHY
+        return {
+            "run_id": run_id,
+            "workflow_id": workflow_id,
+            "principal_sub": principal_user.get("id", ""),
+            "principal_user": principal_user,
+            "dry_run": bool(dry_run),
+            "results": [],
+            "error": {
+                "message": "Workflow execution not authorized",
+                "reason_codes": authz_result.get("reason_codes", []),
+                "advice": authz_result.get("advice", []),
+            },
+        }
+
     # List workflow items using the agent's delegation from the principal
     # Pass principal_user_id so domain-services can verify the agent has delegation from the principal
-    # Authorization for execution is checked per-item below
+    # Authorization for execution is also checked per-item below
     try:
         items = list_workflow_items(
             config=config,
@@ -551,33 +788,24 @@ def execute_workflow_run(
             principal_persona_title=principal_user.get("persona_title"),
             principal_persona_circle=principal_user.get("persona_circle"),
             user_token=user_token,
+            timeout_seconds=endpoints.timeout_seconds,
         )
-    except (ValueError, RuntimeError) as exc:
+    except HttpNon2xxError as exc:
         # If listing workflow items fails with 403, it means the principal lacks read access
         # Return empty results with appropriate error rather than crashing
-        error_str = str(exc)
-        if "http=403" in error_str:
-            # Extract reason codes from error message if available
+        if exc.status_code == 403:
             reason_codes = ["workflow_access_denied"]
             advice_msg = "Principal does not have read access to this workflow"
-            
-            # Try to parse reason codes from the error body
-            if "body=" in error_str:
-                body_parts = error_str.split("body=")
-                if len(body_parts) > 1:
-                    try:
-                        import json
-                        error_body = json.loads(body_parts[1])
-                        if isinstance(error_body, dict):
-                            detail = error_body.get("detail", {})
-                            if isinstance(detail, dict):
-                                reason_codes = detail.get("reason_codes", reason_codes)
-                                advice_list = detail.get("advice", [])
-                                if advice_list and isinstance(advice_list, list) and len(advice_list) > 0:
-                                    advice_msg = advice_list[0].get("message", advice_msg)
-                    except (json.JSONDecodeError, ValueError, KeyError, IndexError):
-                        pass
-            
+
+            # Use reason codes and advice from the error body when available
+            error_body = _parse_json_object_or_none(exc.body_bytes)
+            detail = error_body.get("detail", {}) if error_body else None
+            if isinstance(detail, dict):
+                reason_codes = detail.get("reason_codes", reason_codes)
+                advice_list = detail.get("advice", [])
+                if advice_list and isinstance(advice_list, list) and isinstance(advice_list[0], dict):
+                    advice_msg = advice_list[0].get("message", advice_msg)
+
             return {
                 "run_id": run_id,
                 "workflow_id": workflow_id,
@@ -593,44 +821,30 @@ def execute_workflow_run(
         # Re-raise if not a 403 error
         raise
 
-    results: list[dict[str, Any]] = []
-    for item in items:
-        try:
-            response = execute_workflow_item(
-                config=config,
-                workflow_id=workflow_id,
-                workflow_item_id=item.workflow_item_id,
-                principal_user=principal_user,
-                dry_run=dry_run,
-                user_token=user_token,
-            )
+    def run_item(item: WorkflowItem) -> dict[str, Any]:
+        return _execute_run_item(
+            config=config,
+            workflow_id=workflow_id,
+            item=item,
+            principal_user=principal_user,
+            dry_run=dry_run,
+            user_token=user_token,
+            timeouts=endpoints.timeouts,
+        )
 
-            status = str(response.get("status", "error"))
-            decision = str(response.get("outcome", response.get("decision", "unknown")))
-            reason_codes = list(response.get("reason_codes", []) or [])
-            advice = list(response.get("advice", []) or [])
-
-            results.append(
-                {
-                    "workflow_item_id": item.workflow_item_id,
-                    "kind": item.kind,
-                    "status": status,
-                    "decision": decision,
-                    "reason_codes": reason_codes,
-                    "advice": advice,
-                }
-            )
-        except ValueError as exception:
-            results.append(
-                {
-                    "workflow_item_id": item.workflow_item_id,
-                    "kind": item.kind,
-                    "status": "error",
-                    "decision": "deny",
-                    "reason_codes": ["agent_runner.item_execution_failed"],
-                    "advice": [{"type": "error", "message": str(exception)}],
-                }
-            )
+    # Items are independent and I/O-bound: fan them out over the shared item pool, with at
+    # most max_concurrency of this run's items in flight (the pool size,
+    # FLOWPILOT_ITEM_WORKERS, caps all runs together). Results land in a pre-sized list at
+    # each item's index, so ordering matches items; max_concurrency <= 1 runs sequentially.
+    results: list[dict[str, Any]] = [None] * len(items)  # type: ignore[list-item]
+    max_concurrency = min(len(items), int(config.get("max_concurrency", 8)))
+    item_results = (
+        map(run_item, items)
+        if max_concurrency <= 1
+        else _map_on_item_pool(run_item, items, max_concurrency)
+    )
+    for index, item_result in enumerate(item_results):
+        results[index] = item_result
 
     return {
         "run_id": run_id,
@@ -15,22 +15,27 @@ from __future__ import annotations
 
 import argparse
 import os
-from typing import Any, Dict, Optional
+from collections.abc import Mapping
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Optional
 
+import anyio.to_thread
 import api_logging
 import security
 import uvicorn
 from ai_agent_core import (
-    check_workflow_execution_authorization,
     execute_workflow_run,
     normalize_workflow_id,
 )
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, validator
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, Field, field_validator
 from utils import (
+    ORJSON_AVAILABLE,
     coerce_positive_int,
     load_json_object,
     merge_config,
@@ -40,6 +45,9 @@ from utils import (
 # Environment flag for detailed error messages (disable in production)
 INCLUDE_ERROR_DETAILS = os.environ.get("INCLUDE_ERROR_DETAILS", "1") == "1"
 
+# Serialize responses with orjson when installed (falls back to stdlib json)
+JSON_RESPONSE_CLASS = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
 
 DEFAULT_CONFIG: dict[str, Any] = {
     "service_name": "agent-runner-api",
@@ -54,6 +62,9 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "workflow_item_execute_path_template": "/v1/workflows/{workflow_id}/items/{workflow_item_id}/execute",
     # Operational timeouts.
     "request_timeout_seconds": 10,
+    # Maximum workflow items of one run executing at once (1 = sequential). Items run on
+    # the shared item pool, whose size (FLOWPILOT_ITEM_WORKERS) caps all runs together.
+    "max_concurrency": 8,
 }
 
 
@@ -72,20 +83,16 @@ class WorkflowRunRequest(BaseModel):
         ..., min_length=1, max_length=255, description="Persona circle to uniquely identify persona (required)"
     )
 
-    @validator("workflow_id")
+    @field_validator("workflow_id")
+    @classmethod
     def validate_workflow_id(cls, v: str) -> str:
         return security.validate_id(v, "workflow_id", 255)
 
-    @validator("principal_sub")
-    def sanitize_principal_sub(cls, v: str) -> str:
-        return security.sanitize_string(v, 255)
-
-    @validator("persona_title")
-    def sanitize_persona_title(cls, v: str) -> str:
-        return security.sanitize_string(v, 255)
-
-    @validator("persona_circle")
-    def sanitize_persona_circle(cls, v: str) -> str:
+    # Length is already enforced by the Field constraints; sanitize_string adds the
+    # control-character / payload-signature checks.
+    @field_validator("principal_sub", "persona_title", "persona_circle")
+    @classmethod
+    def sanitize_text_fields(cls, v: str) -> str:
         return security.sanitize_string(v, 255)
 
 
@@ -120,6 +127,10 @@ def build_config(config_path: str | None) -> dict[str, Any]:
         ),
         "REQUEST_TIMEOUT_SECONDS",
     )
+    config["max_concurrency"] = coerce_positive_int(
+        os.environ.get("MAX_CONCURRENCY", str(config["max_concurrency"])),
+        "MAX_CONCURRENCY",
+    )
 
     require_non_empty_string(
         str(config.get("workflow_base_url", "")), "workflow_base_url"
@@ -147,43 +158,29 @@ def handle_get_health(_request: Request) -> dict[str, str]:
 def handle_post_workflow_runs(
     request: Request,
     body: WorkflowRunRequest,
-    token_claims: dict = Depends(security.verify_token),
+    bearer: tuple[dict[str, Any], str] = Depends(security.verify_bearer_token),
 ) -> dict[str, Any]:
     # Execute a workflow by iterating items and delegating execution to domain service endpoints (domain is PEP).
-    # AuthZEN: Extract user token, decode to get principal info, check authorization before starting.
-    config: dict[str, Any] = request.app.state.config
+    # AuthZEN: Take principal info from the verified token claims, check authorization before starting.
+    config: Mapping[str, Any] = request.app.state.config
 
     try:
-        # Extract user token from Authorization header (the client's token)
-        user_token = None
-        auth_header = request.headers.get("authorization", "")
-        if auth_header.lower().startswith("bearer "):
-            user_token = auth_header[7:]  # Remove "Bearer " prefix
-
-        # Decode user token to extract principal information (AuthZEN: disassemble token)
-        # SECURITY: Fail-closed - if token verification fails, reject the request
+        # Verified claims plus the raw bearer token (forwarded to downstream services)
+        token_claims, user_token = bearer
+
+        # SECURITY: Fail-closed - the user token is required for downstream calls
         if not user_token:
             raise HTTPException(
                 status_code=401,
                 detail="Missing authentication token - user token is required for workflow execution"
             )
-        
-        try:
-            user_claims = security.verify_token_string(user_token)
-        except Exception as e:
-            # SECURITY: Token verification failed - do NOT fall back to request body
-            # Reject immediately to prevent authentication bypass
-            raise HTTPException(
-                status_code=401,
-                detail=f"Token verification failed: {str(e) if INCLUDE_ERROR_DETAILS else 'Invalid token'}"
-            ) from e
-        
+
         # Create principal-user object with explicit persona_title and persona_circle
         # Note: Excluding PII (email, preferred_username) for privacy
         # Note: Autobook attributes are fetched by authz-api for the resource owner, not passed here
         principal_user = {
             "type": "user",
-            "id": user_claims.get("sub", body.principal_sub),  # Use token sub, fallback to body
+            "id": token_claims.get("sub") or body.principal_sub,  # Use token sub, fallback to body
             "persona_title": body.persona_title,
             "persona_circle": body.persona_circle,
         }
@@ -194,45 +191,17 @@ def handle_post_workflow_runs(
         # The agent acts on behalf of the user with the user's token
         agent_sub = "agent-runner"
 
-        # AuthZEN: Check workflow-level authorization before starting execution
-        # This prevents wasted work by checking if ANY item could be executed
-        authz_result = check_workflow_execution_authorization(
-            config=config,
-            workflow_id=workflow_id,
-            principal_user=principal_user,
-            agent_sub=agent_sub,
-            user_token=user_token,
-        )
-
-        if authz_result.get("decision") != "allow":
-            # Return structured denial with reason codes instead of raising HTTPException
-            # This allows the client to see WHY the workflow cannot be executed
-            reason_codes = authz_result.get("reason_codes", [])
-            advice = authz_result.get("advice", [])
-            
-            # Return early with empty results and error information
-            return {
-                "run_id": "wr_" + workflow_id[:10],  # Generate placeholder run_id
-                "workflow_id": workflow_id,
-                "principal_sub": principal_user.get("id", ""),
-                "principal_user": principal_user,
-                "dry_run": bool(body.dry_run),
-                "results": [],
-                "error": {
-                    "message": "Workflow execution not authorized",
-                    "reason_codes": reason_codes,
-                    "advice": advice,
-                },
-            }
-
         # Execute workflow with principal-user object (AuthZEN: pass principal info, not token)
         # Pass user token for service-to-service calls (agent acts on behalf of user)
+        # execute_workflow_run checks workflow-level authorization before listing or
+        # executing any item and returns a structured denial (reason codes + advice)
         result = execute_workflow_run(
             config=config,
             workflow_id=workflow_id,
             principal_user=principal_user,
             dry_run=bool(body.dry_run),
             user_token=user_token,
+            agent_sub=agent_sub,
         )
 
         return result
@@ -255,14 +224,15 @@ def handle_post_workflow_runs(
         ) from exc
 
 
-def handle_post_agent_runs(
-    request: Request,
-    body: WorkflowRunRequest,
-    token_claims: dict = Depends(security.verify_token),
-) -> dict[str, Any]:
-    # Backward-compatible alias for older clients
-    # why: preserve existing scripts and desktop app wiring.
-    return handle_post_workflow_runs(request, body, token_claims)
+@asynccontextmanager
+async def _lifespan(_api: FastAPI) -> AsyncIterator[None]:
+    # Size the threadpool that runs the sync handlers
+    # why: a workflow run holds its worker thread for every downstream round-trip, and
+    # anyio's default of 40 threads caps concurrent runs well below limit_concurrency.
+    # side effect: adjusts the process-wide anyio default thread limiter.
+    handler_threads = int(os.environ.get("HANDLER_THREADPOOL_SIZE", "100"))
+    anyio.to_thread.current_default_thread_limiter().total_tokens = handler_threads
+    yield
 
 
 def create_app(config: dict[str, Any]) -> FastAPI:
@@ -277,8 +247,11 @@ def create_app(config: dict[str, Any]) -> FastAPI:
         # Limit request body size to 1MB (protects against large payload attacks)
         # Can be overridden per endpoint if needed
         swagger_ui_parameters={"defaultModelsExpandDepth": -1},
+        lifespan=_lifespan,
+        default_response_class=JSON_RESPONSE_CLASS,
     )
-    api.state.config = config
+    # Config is fixed once the app is built: expose it read-only to the handlers
+    api.state.config = MappingProxyType(dict(config))
 
     # Add CORS middleware
     cors_config = security.get_cors_config()
@@ -296,13 +269,20 @@ def create_app(config: dict[str, Any]) -> FastAPI:
         security.RequestSizeLimiterMiddleware, max_size=security.get_max_request_size()
     )
 
+    # Compress larger responses (workflow runs carry one result per item)
+    api.add_middleware(
+        GZipMiddleware,
+        minimum_size=int(os.environ.get("GZIP_MINIMUM_SIZE", "1024")),
+        compresslevel=5,
+    )
+
     # Exception handler for request validation errors
     @api.exception_handler(RequestValidationError)
     async def validation_exception_handler(
         request: Request, exc: RequestValidationError
     ):
         # Log the validation error
-        return JSONResponse(
+        return JSON_RESPONSE_CLASS(
             status_code=422,
             content={"detail": exc.errors(), "body": exc.body},
         )
@@ -311,7 +291,7 @@ def create_app(config: dict[str, Any]) -> FastAPI:
     @api.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
         # Log HTTP exceptions
-        return JSONResponse(
+        return JSON_RESPONSE_CLASS(
             status_code=exc.status_code,
             content=(
                 {"detail": exc.detail}
@@ -323,18 +303,19 @@ def create_app(config: dict[str, Any]) -> FastAPI:
     # Health check - no auth required
     api.add_api_route("/health", handle_get_health, methods=["GET"])
 
-    # All other endpoints require authentication
+    # All other endpoints require authentication (enforced by the handler's
+    # security.verify_bearer_token dependency)
     api.add_api_route(
         "/v1/workflow-runs",
         handle_post_workflow_runs,
         methods=["POST"],
-        dependencies=[Depends(security.verify_token)],
     )
+    # Backward-compatible alias for older clients (same handler)
+    # why: preserve existing scripts and desktop app wiring.
     api.add_api_route(
         "/v1/agent-runs",
-        handle_post_agent_runs,
+        handle_post_workflow_runs,
         methods=["POST"],
-        dependencies=[Depends(security.verify_token)],
     )
 
     return api
@@ -377,6 +358,10 @@ def main() -> int:
     uvicorn_max_requests = int(os.environ.get("UVICORN_MAX_REQUESTS", "10000"))
     uvicorn_max_concurrency = int(os.environ.get("UVICORN_MAX_CONCURRENCY", "100"))
     uvicorn_keepalive_timeout = int(os.environ.get("UVICORN_KEEPALIVE_TIMEOUT", "5"))
+    # "auto" selects uvloop/httptools when installed (see requirements.txt) and falls
+    # back to asyncio/h11 otherwise (e.g. on Windows, where uvloop is unavailable)
+    uvicorn_loop = os.environ.get("UVICORN_LOOP", "auto")
+    uvicorn_http = os.environ.get("UVICORN_HTTP", "auto")
 
     uvicorn.run(
         api,
@@ -388,6 +373,8 @@ def main() -> int:
         limit_max_requests=uvicorn_max_requests,  # Max requests before worker restart
         limit_concurrency=uvicorn_max_concurrency,  # Max concurrent connections
         timeout_keep_alive=uvicorn_keepalive_timeout,  # Keep-alive timeout
+        loop=uvicorn_loop,  # Event loop implementation (uvloop when available)
+        http=uvicorn_http,  # HTTP protocol implementation (httptools when available)
     )
     return 0
 
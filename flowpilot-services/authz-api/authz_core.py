@@ -2,6 +2,10 @@
 #
 # Design goals
 # - Keep policy evaluation simple: call a plain OPA server (HTTP) running in "server mode".
+#   OPA is deliberately not embedded (WASM) in-process: the server runs with --watch so
+#   policy edits apply without rebuilding this image, and the policies rely on builtins
+#   the WASM target does not fully support. The HTTP hop is kept cheap instead: one
+#   package query per decision over the pooled keep-alive session, orjson-encoded.
 # - Keep the AuthZ API responsible for:
 #   - authenticating callers (via shared security.py)
 #   - shaping input for the Rego policy
@@ -17,7 +21,13 @@
 
 from __future__ import annotations
 
+import hashlib
+import logging
 import os
+import sys
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any, Dict, List, Optional
@@ -27,6 +37,8 @@ import requests
 import security
 from policy_manifest import PolicyAttribute, PolicyManifest, PolicyRegistry
 from utils import (
+    HttpNon2xxError,
+    TTLCache,
     build_timeouts,
     coerce_bool,
     coerce_dict,
@@ -35,7 +47,9 @@ from utils import (
     get_http_config,
     http_get_json,
     http_post_json,
+    json_dumps_canonical_bytes,
     normalize_departure_date,
+    read_env_float,
     read_env_string,
 )
 
@@ -45,7 +59,7 @@ from utils import (
 
 # Allowed actions will be derived from policy manifests
 # See _build_policy_registry() which collects all allowed-actions from persona_config
-ALLOWED_ACTIONS: set[str] = set()  # Populated after registry is built
+ALLOWED_ACTIONS: frozenset[str] = frozenset()  # Populated after registry is built
 
 
 @dataclass(frozen=True)
@@ -55,6 +69,7 @@ class OpaConfig:
     policy_manifest: PolicyManifest
     allow_rule: str = "allow"
     reason_rule: str = "reasons"
+    decision_rule: str = "decision"
     connect_timeout_seconds: float = 3.0
     read_timeout_seconds: float = 10.0
 
@@ -62,21 +77,51 @@ class OpaConfig:
 class OpaClient:
     def __init__(self, config: OpaConfig) -> None:
         self._config = config
+        # Pre-render the data API URLs and timeouts once (fixed per OpaConfig)
+        data_url = f"{config.base_url.rstrip('/')}/v1/data/{config.package.strip('/')}"
+        self._package_url = data_url
+        self._allow_url = f"{data_url}/{config.allow_rule}"
+        self._reasons_url = f"{data_url}/{config.reason_rule}"
+        self._decision_url = f"{data_url}/{config.decision_rule}"
+        self._timeouts = build_timeouts(
+            connect_seconds=config.connect_timeout_seconds,
+            read_seconds=config.read_timeout_seconds,
+        )
 
     def evaluate_allow(self, input_document: dict[str, Any]) -> bool:
-        result = self._post_data(
-            path=f"{self._config.package}/{self._config.allow_rule}",
-            input_document=input_document,
-        )
+        result = self._post(self._allow_url, input_document)
         # OPA data API: {"result": <value>}
         return bool(result.get("result", False))
 
+    def evaluate(self, input_document: dict[str, Any]) -> tuple[bool, list[str]]:
+        # Evaluate allow + reasons with a single OPA query
+        # why: one OPA round-trip per decision instead of one per rule. The policy's
+        # decision rule ({"allow": ..., "reasons": ...}) is queried so OPA evaluates only
+        # what it needs; policies without that rule fall back to the package document.
+        # OPA data API: {"result": <value>} (result omitted if undefined)
+        result = self._post(self._decision_url, input_document)
+        if "result" not in result:
+            result = self._post(self._package_url, input_document)
+            package_document = result.get("result") or {}
+            if not isinstance(package_document, dict):
+                package_document = {}
+            return (
+                bool(package_document.get(self._config.allow_rule, False)),
+                self._normalize_reasons(package_document.get(self._config.reason_rule, [])),
+            )
+        decision_document = result.get("result") or {}
+        if not isinstance(decision_document, dict):
+            decision_document = {}
+        is_allowed = bool(decision_document.get("allow", False))
+        reasons = self._normalize_reasons(decision_document.get("reasons", []))
+        return is_allowed, reasons
+
     def evaluate_reasons(self, input_document: dict[str, Any]) -> list[str]:
-        result = self._post_data(
-            path=f"{self._config.package}/{self._config.reason_rule}",
-            input_document=input_document,
-        )
-        reasons = result.get("result", [])
+        result = self._post(self._reasons_url, input_document)
+        return self._normalize_reasons(result.get("result", []))
+
+    @staticmethod
+    def _normalize_reasons(reasons: Any) -> list[str]:
         if reasons is None:
             return []
         if isinstance(reasons, list):
@@ -86,14 +131,8 @@ class OpaClient:
             return [str(key) for key in reasons.keys()]
         return [str(reasons)]
 
-    def _post_data(self, path: str, input_document: dict[str, Any]) -> dict[str, Any]:
-        url = f"{self._config.base_url.rstrip('/')}/v1/data/{path.lstrip('/')}"
-        payload = {"input": input_document}
-        timeouts = build_timeouts(
-            connect_seconds=self._config.connect_timeout_seconds,
-            read_seconds=self._config.read_timeout_seconds,
-        )
-        return http_post_json(url=url, payload=payload, timeouts=timeouts)
+    def _post(self, url: str, input_document: dict[str, Any]) -> dict[str, Any]:
+        return http_post_json(url=url, payload={"input": input_document}, timeouts=self._timeouts)
 
 
 def _build_opa_client_for_policy(manifest: PolicyManifest) -> OpaClient:
@@ -113,6 +152,15 @@ def _build_opa_client_for_policy(manifest: PolicyManifest) -> OpaClient:
     return OpaClient(config=config)
 
 
+@lru_cache(maxsize=32)
+def _opa_client_for_policy_name(policy_name: str) -> OpaClient:
+    # One OpaClient per loaded policy, reused across requests
+    # why: building a client re-reads OPA_URL and re-renders URLs/timeouts; the policy
+    # set is fixed at import, so the client for a given policy never changes.
+    # assumptions: keyed by name because PolicyManifest holds lists and is unhashable.
+    return _build_opa_client_for_policy(_POLICY_REGISTRY.get_policy_by_name(policy_name))
+
+
 def _build_policy_registry() -> PolicyRegistry:
     """Build policy registry from environment configuration.
     
@@ -127,12 +175,25 @@ def _build_policy_registry() -> PolicyRegistry:
 # Module-Level Clients and Services
 # ============================================================================
 
+_LOGGER = logging.getLogger(__name__)
+
 # Policy registry instance (initialized on module load)
 _POLICY_REGISTRY = _build_policy_registry()
 
+# policy_hint -> manifest for the hot path (the policy set is fixed after load; names are
+# interned so matching hint strings compare by identity first)
+_POLICIES_BY_HINT: dict[str, PolicyManifest] = {
+    sys.intern(policy_name): policy
+    for policy_name, policy in _POLICY_REGISTRY.policies.items()
+}
+
 # Populate allowed actions from all loaded policies
 ALLOWED_ACTIONS = _POLICY_REGISTRY.get_all_allowed_actions()
-print(f"Allowed actions (from policy manifests): {', '.join(sorted(ALLOWED_ACTIONS))}", flush=True)
+# %s-style args: formatting only happens if INFO is enabled for this logger
+_LOGGER.info("Allowed actions (from policy manifests): %s", ALLOWED_ACTIONS)
+
+# Sorted, joined list for invalid-action error messages (computed once)
+_ALLOWED_ACTIONS_STR = ", ".join(sorted(ALLOWED_ACTIONS))
 
 # Delegation API configuration (required environment variables)
 _DELEGATION_API_BASE_URL = read_env_string("DELEGATION_API_BASE_URL")
@@ -140,16 +201,153 @@ _DELEGATION_API_BASE_URL = read_env_string("DELEGATION_API_BASE_URL")
 # User Profile API configuration (required environment variables)
 _PERSONA_API_BASE_URL = read_env_string("PERSONA_API_BASE_URL")
 
+# Pre-rendered PIP endpoint URLs (base URLs are fixed for the process lifetime)
+_PERSONAS_URL_PREFIX = f"{_PERSONA_API_BASE_URL.rstrip('/')}/v1/personas/"
+_DELEGATION_VALIDATE_URL = f"{_DELEGATION_API_BASE_URL.rstrip('/')}/v1/delegations/validate"
+
+# PIP (persona-api / delegation-api) timeouts
+# why: the PIPs are sibling services on the same network; a short connect timeout fails
+# fast on a dead peer instead of parking an evaluate thread for the global HTTP timeout.
+_PIP_TIMEOUTS = build_timeouts(
+    connect_seconds=read_env_float("PIP_CONNECT_TIMEOUT_SECONDS", 1.0),
+    read_seconds=read_env_float("PIP_READ_TIMEOUT_SECONDS", 5.0),
+)
+
+# Last service token and its Authorization header; rebuilt only when the token rotates
+_service_auth_headers_cache: tuple[str, dict[str, str]] | None = None
+
 # Persona cache configuration
 # Cache size: 256 personas (sufficient for most deployments)
-# TTL: Handled by LRU eviction (stale data risk is acceptable for short-lived requests)
+# TTL: 15s by default, so persona changes (status, attributes) reach OPA within seconds
+# while repeated runs by the same user skip the persona-api round-trip.
 _PERSONA_CACHE_SIZE = int(os.environ.get("PERSONA_CACHE_SIZE", "256"))
+_PERSONA_CACHE_TTL_SECONDS = int(os.environ.get("PERSONA_CACHE_TTL_SECONDS", "15"))
+_PERSONA_CACHE = TTLCache(maxsize=_PERSONA_CACHE_SIZE, ttl_seconds=_PERSONA_CACHE_TTL_SECONDS)
+
+# Negative cache for persona_ids persona-api answered with 404.
+# Kept short (5s default) so a newly created persona becomes visible quickly, while a
+# burst of requests for an unknown persona costs one round-trip instead of one each.
+_PERSONA_MISS_CACHE_TTL_SECONDS = int(os.environ.get("PERSONA_MISS_CACHE_TTL_SECONDS", "5"))
+_PERSONA_MISS_CACHE = TTLCache(maxsize=_PERSONA_CACHE_SIZE, ttl_seconds=_PERSONA_MISS_CACHE_TTL_SECONDS)
+
+
+# Delegation cache configuration
+# Keyed by (owner_id, principal_id, workflow_id); requested_action is not sent to the
+# delegation-api, so it is not part of the key. TTL kept as short as the persona cache
+# (15s default) so revoked delegations stop applying within seconds.
+_DELEGATION_CACHE_SIZE = int(os.environ.get("DELEGATION_CACHE_SIZE", "10000"))
+_DELEGATION_CACHE_TTL_SECONDS = int(os.environ.get("DELEGATION_CACHE_TTL_SECONDS", "15"))
+_DELEGATION_CACHE = TTLCache(maxsize=_DELEGATION_CACHE_SIZE, ttl_seconds=_DELEGATION_CACHE_TTL_SECONDS)
+
+# Shared "no delegation" value (tuples: immutable, so one instance serves every request)
+_EMPTY_DELEGATION: dict[str, Any] = {"delegation_chain": (), "delegated_actions": ()}
+
+# In-flight persona fetches (persona_id -> Future), used to coalesce concurrent misses
+_PERSONA_INFLIGHT: dict[str, Future] = {}
+_PERSONA_INFLIGHT_LOCK = threading.Lock()
+
+
+def clear_persona_cache() -> None:
+    # Drop all cached personas and misses (tests, persona updates that must apply immediately)
+    _PERSONA_CACHE.clear()
+    _PERSONA_MISS_CACHE.clear()
+
+
+def clear_delegation_cache() -> None:
+    # Drop all cached delegation lookups (tests, revocations that must apply immediately)
+    _DELEGATION_CACHE.clear()
+
+# Worker pool for PIP lookups that can overlap (principal persona + delegation chain)
+_PIP_WORKERS = int(os.environ.get("PIP_FETCH_WORKERS", "16"))
+_PIP_POOL = ThreadPoolExecutor(max_workers=_PIP_WORKERS, thread_name_prefix="authz-pip")
+
+
+def _coerce_string(value: Any) -> str:
+    # String (or unknown) manifest type: coerce to string, None becomes ""
+    return str(value) if value is not None else ""
+
+
+def _coerce_integer(value: Any) -> int:
+    return coerce_int(value, 0)
+
+
+def _coerce_boolean(value: Any) -> bool:
+    return coerce_bool(value, False)
+
+
+# Manifest attribute type -> coercion function (unknown types coerce to string)
+_ATTRIBUTE_COERCERS = {
+    "float": coerce_float,
+    "integer": _coerce_integer,
+    "date": normalize_departure_date,
+    "boolean": _coerce_boolean,
+}
+
+# Manifest attribute type -> Python type a value already has when no coercion is needed.
+# "date" is absent: normalize_departure_date always runs (it reformats strings).
+_ATTRIBUTE_NATIVE_TYPES = {
+    "string": str,
+    "float": float,
+    "integer": int,
+    "boolean": bool,
+}
+
+
+# Manifest default types that keep a PolicyAttribute hashable (lru_cache key)
+_SCALAR_DEFAULT_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=64)
+def _compile_normalize_pipeline(
+    policy_attributes: tuple[PolicyAttribute, ...],
+) -> tuple[tuple[str, Any, bool, Any, type | None], ...]:
+    # Resolve each manifest attribute to (name, default, required, coerce_fn, native_type) once
+    # why: manifests are fixed after load, so the per-request type dispatch is pure overhead.
+    # native_type lets well-typed input (the common case for sibling-service PEPs) skip the
+    # coercion call; None means always coerce.
+    return tuple(
+        (
+            attr.name,
+            attr.default,
+            attr.required,
+            _ATTRIBUTE_COERCERS.get(attr.type, _coerce_string),
+            _ATTRIBUTE_NATIVE_TYPES.get(attr.type, None if attr.type in _ATTRIBUTE_COERCERS else str),
+        )
+        for attr in policy_attributes
+    )
+
+
+@lru_cache(maxsize=32)
+def _persona_attribute_names(policy_name: str) -> frozenset[str]:
+    # Names of the policy's persona attributes, resolved once per policy
+    # why: owner enrichment copies exactly these keys from the persona; the set is fixed
+    # per manifest, so intersecting it with the persona keys (in C) replaces a per-request
+    # walk over PolicyAttribute objects.
+    policy = _POLICY_REGISTRY.get_policy_by_name(policy_name)
+    return frozenset(attr.name for attr in policy.persona_attributes)
+
+
+def _service_auth_headers() -> dict[str, str] | None:
+    # Return the Authorization header for the current service token, or None if unavailable
+    # why: the token changes only on rotation, so reuse the header dict between PIP calls.
+    # assumptions: callers never mutate the returned dict (requests merges headers by copy).
+    global _service_auth_headers_cache
+    service_token = security.get_service_token()
+    if not service_token:
+        return None
+    cached = _service_auth_headers_cache
+    if cached is not None and cached[0] == service_token:
+        return cached[1]
+    headers = {"Authorization": f"Bearer {service_token.strip()}"}
+    _service_auth_headers_cache = (service_token, headers)
+    return headers
 
 
 def normalize_attributes(
     attributes_dict: dict[str, Any],
-    policy_attributes: list[PolicyAttribute],
+    policy_attributes: Sequence[PolicyAttribute],
     source_type: str,  # "persona" or "resource"
+    copy: bool = True,
 ) -> dict[str, Any]:
     """Normalize attributes: apply defaults, validate required, and coerce types.
     
@@ -158,10 +356,14 @@ def normalize_attributes(
     2. Validate all required attributes are present
     3. Coerce attribute values to manifest types
     
+    The per-attribute coercion functions are resolved once per manifest attribute list
+    (see _compile_normalize_pipeline) rather than dispatched on type for every call.
+    
     Args:
         attributes_dict: Dictionary of attribute values (from persona or resource)
         policy_attributes: List of PolicyAttribute definitions from manifest
         source_type: Type of attributes being normalized ("persona" or "resource")
+        copy: If False, normalize attributes_dict in place (for callers that own a fresh dict)
     
     Returns:
         Normalized dictionary with defaults applied, validated, and type-coerced
@@ -169,43 +371,35 @@ def normalize_attributes(
     Raises:
         ValueError: If required attributes are missing or type coercion fails
     """
-    result = dict(attributes_dict)
-    
-    # Step 1: Apply defaults for missing attributes
-    for attr in policy_attributes:
-        if attr.name not in result or result[attr.name] is None:
-            if attr.default is not None:
-                result[attr.name] = attr.default
+    policy_attributes = tuple(policy_attributes)
+    if all(isinstance(attr.default, _SCALAR_DEFAULT_TYPES) for attr in policy_attributes):
+        pipeline = _compile_normalize_pipeline(policy_attributes)
+    else:
+        # Non-scalar manifest default (e.g. a list) cannot key the cache: compile uncached
+        pipeline = _compile_normalize_pipeline.__wrapped__(policy_attributes)
+
+    result = dict(attributes_dict) if copy else attributes_dict
     
-    # Step 2: Validate required attributes are present
+    # Steps 1 + 2: Apply defaults and collect missing required attributes in one pass
     missing_required = []
-    for attr in policy_attributes:
-        if attr.required:
-            if attr.name not in result or result[attr.name] is None:
-                missing_required.append(attr.name)
+    for name, default, required, _coerce, _native_type in pipeline:
+        if result.get(name) is None:
+            if default is not None:
+                result[name] = default
+            elif required:
+                missing_required.append(name)
     
     if missing_required:
         raise ValueError(
             f"Missing required {source_type} attributes: {', '.join(missing_required)}"
         )
     
-    # Step 3: Coerce attribute values to manifest types
-    for attr in policy_attributes:
-        if attr.name in result:
-            attr_value = result[attr.name]
-            attr_type = attr.type
-            
-            # Coerce based on type
-            if attr_type == "float":
-                result[attr.name] = coerce_float(attr_value)
-            elif attr_type == "integer":
-                result[attr.name] = coerce_int(attr_value, 0)
-            elif attr_type == "date":
-                result[attr.name] = normalize_departure_date(attr_value)
-            elif attr_type == "boolean":
-                result[attr.name] = coerce_bool(attr_value, False)
-            else:  # string or unknown - coerce to string if not None
-                result[attr.name] = str(attr_value) if attr_value is not None else ""
+    # Step 3: Coerce attribute values to manifest types (exact-type values are left as is)
+    for name, _default, _required, coerce, native_type in pipeline:
+        if name in result:
+            value = result[name]
+            if native_type is None or type(value) is not native_type:
+                result[name] = coerce(value)
     
     return result
 
@@ -213,8 +407,31 @@ def normalize_attributes(
 @dataclass(frozen=True)
 class EvaluateResult:
     decision: str  # "allow" | "deny"
-    reason_codes: list[str]
-    advice: list[dict[str, Any]]
+    reason_codes: Sequence[str]  # shared tuples for fixed denials, OPA list otherwise
+    advice: Sequence[dict[str, Any]]
+
+
+# Immutable, shareable reason codes / advice for the fixed deny and decision paths
+_REASONS_INVALID_SUBJECT = ("authz.invalid_subject",)
+_REASONS_INVALID_ACTION = ("authz.invalid_action",)
+_REASONS_MISSING_REQUIRED_ATTRIBUTES = ("authz.missing_required_attributes",)
+_REASONS_PERSONA_FETCH_FAILED = ("authz.persona_fetch_failed",)
+_REASONS_SYSTEM_ERROR = ("authz.system_error",)
+_EMPTY_ADVICE: tuple[dict[str, Any], ...] = ()
+
+
+def _deny(reason_codes: tuple[str, ...], message: str) -> EvaluateResult:
+    # Deny result with a shared reason tuple; only the advice entry is allocated
+    return EvaluateResult(decision="deny", reason_codes=reason_codes, advice=({"message": message},))
+
+
+def _decision(is_allowed: bool, reasons: Sequence[str]) -> EvaluateResult:
+    # Result for an OPA decision (OPA returns no advice)
+    return EvaluateResult(
+        decision="allow" if is_allowed else "deny",
+        reason_codes=reasons,
+        advice=_EMPTY_ADVICE,
+    )
 
 
 # ============================================================================
@@ -222,17 +439,17 @@ class EvaluateResult:
 # ============================================================================
 
 
-@lru_cache(maxsize=_PERSONA_CACHE_SIZE)
 def fetch_persona(persona_id: str) -> dict[str, Any]:
-    # Fetch persona from persona-api with LRU caching.
+    # Fetch persona from persona-api with TTL caching.
     # Returns full persona object with policy-specific attributes.
     #
     # This function acts as a Policy Information Point (PIP) - it fetches data
     # needed for authorization decisions.
     #
-    # CACHING: Uses LRU cache to avoid repeated API calls for the same persona.
-    # Cache size is configurable via PERSONA_CACHE_SIZE environment variable (default: 256).
-    # Stale data risk is acceptable since personas rarely change during active sessions.
+    # CACHING: Uses a TTL cache to avoid repeated API calls for the same persona.
+    # Cache size is configurable via PERSONA_CACHE_SIZE (default: 256) and freshness via
+    # PERSONA_CACHE_TTL_SECONDS (default: 15). 404s are remembered for
+    # PERSONA_MISS_CACHE_TTL_SECONDS (default: 5); other errors are never cached.
     #
     # IMPORTANT: persona-api pre-validates all persona attributes:
     # - Applies defaults from policy manifest for missing attributes
@@ -257,24 +474,69 @@ def fetch_persona(persona_id: str) -> dict[str, Any]:
     # Raises:
     #     RuntimeError: If service token is not available or API call fails
 
+    return _fetch_persona_cached(persona_id)
+
+
+def _fetch_persona_cached(persona_id: str) -> dict[str, Any]:
+    # Shared persona-api GET behind the TTL cache (keyed by persona_id)
+    cached_persona = _PERSONA_CACHE.get(persona_id)
+    if cached_persona is not None:
+        return cached_persona
+    if _PERSONA_MISS_CACHE.get(persona_id) is not None:
+        return {}
+
+    # Coalesce concurrent misses for the same persona into one persona-api call
+    # why: owner and principal personas are fetched in parallel and are often the same
+    # persona (principal == owner), so both lookups would otherwise miss and hit the API.
+    with _PERSONA_INFLIGHT_LOCK:
+        inflight = _PERSONA_INFLIGHT.get(persona_id)
+        if inflight is None:
+            inflight = Future()
+            _PERSONA_INFLIGHT[persona_id] = inflight
+            is_leader = True
+        else:
+            is_leader = False
+    if not is_leader:
+        return inflight.result()
+
+    try:
+        persona = _fetch_persona_uncached(persona_id)
+    except BaseException as e:
+        inflight.set_exception(e)
+        raise
+    else:
+        inflight.set_result(persona)
+        return persona
+    finally:
+        with _PERSONA_INFLIGHT_LOCK:
+            _PERSONA_INFLIGHT.pop(persona_id, None)
+
+
+def _fetch_persona_uncached(persona_id: str) -> dict[str, Any]:
+    # persona-api GET; fills the persona (or miss) cache on the way out
     # Get service token for persona API authentication
-    service_token = security.get_service_token()
-    if not service_token:
+    headers = _service_auth_headers()
+    if headers is None:
         raise RuntimeError("Service token not available - cannot fetch persona")
 
-    headers = {"Authorization": f"Bearer {service_token.strip()}"}
-    url = f"{_PERSONA_API_BASE_URL.rstrip('/')}/v1/personas/{persona_id}"
+    url = _PERSONAS_URL_PREFIX + persona_id
 
     try:
-        return http_get_json(url=url, headers=headers)
+        persona = http_get_json(url=url, headers=headers, timeout_seconds=_PIP_TIMEOUTS)
     except RuntimeError as e:
-        # If persona not found (404), return empty dict and fall back to defaults
-        if "404" in str(e):
+        # If persona not found (404), return empty dict and fall back to defaults.
+        # Branch on the real status code: the message text also carries the URL (and so
+        # the persona id), and only a genuine 404 may be negative-cached.
+        if isinstance(e, HttpNon2xxError) and e.status_code == 404:
+            _PERSONA_MISS_CACHE.set(persona_id, True)
             return {}
         raise RuntimeError(f"Failed to fetch persona {persona_id}: {e}") from e
 
+    if persona:
+        _PERSONA_CACHE.set(persona_id, persona)
+    return persona
+
 
-@lru_cache(maxsize=_PERSONA_CACHE_SIZE)
 def fetch_persona_by_triplet(user_sub: str, persona_title: str, persona_circle: str) -> dict[str, Any]:
     # Fetch persona by user_sub and title from persona-api with LRU caching.
     # Returns the persona matching the title (and optionally circle), regardless of status.
@@ -287,8 +549,8 @@ def fetch_persona_by_triplet(user_sub: str, persona_title: str, persona_circle:
     # listing all personas and filtering. Persona IDs follow format: {user_sub}_{title}_{circle}
     # This reduces lookup time from O(n) to O(1) where n is the number of personas per user.
     #
-    # CACHING: Uses LRU cache to avoid repeated API calls for the same persona lookup.
-    # Cache key includes all three parameters (user_sub, title, circle) for correctness.
+    # CACHING: Shares fetch_persona's TTL cache. The composite persona_id encodes all three
+    # parameters (user_sub, title, circle), so it is a correct cache key.
     #
     # Args:
     #     user_sub: User subject ID
@@ -308,26 +570,12 @@ def fetch_persona_by_triplet(user_sub: str, persona_title: str, persona_circle:
             f"User: {user_sub}, Title: {persona_title}"
         )
 
-    # Get service token for persona API authentication
-    service_token = security.get_service_token()
-    if not service_token:
-        raise RuntimeError("Service token not available - cannot fetch personas")
-
     # Construct composite persona_id for direct O(1) lookup
     # Persona IDs in Firestore use format: {user_sub}_{title}_{circle}
     persona_id = f"{user_sub}_{persona_title}_{persona_circle}"
-    
-    headers = {"Authorization": f"Bearer {service_token.strip()}"}
-    url = f"{_PERSONA_API_BASE_URL.rstrip('/')}/v1/personas/{persona_id}"
 
-    try:
-        # Direct document get - O(1) lookup instead of O(n) list+filter
-        return http_get_json(url=url, headers=headers)
-    except RuntimeError as e:
-        # If persona not found (404), return empty dict
-        if "404" in str(e):
-            return {}
-        raise RuntimeError(f"Failed to fetch persona {persona_id}: {e}") from e
+    # Direct document get - O(1) lookup instead of O(n) list+filter
+    return _fetch_persona_cached(persona_id)
 
 
 def compute_delegation_chain(
@@ -360,14 +608,21 @@ def compute_delegation_chain(
     #
     # Raises:
     #     RuntimeError: If service token is not available
+    #
+    # CACHING: Successful lookups are cached for DELEGATION_CACHE_TTL_SECONDS (default: 15);
+    # failures are never cached.
+
+    cache_key = (owner_id, principal_id, workflow_id)
+    cached_delegation = _DELEGATION_CACHE.get(cache_key)
+    if cached_delegation is not None:
+        return cached_delegation
 
     # Get service token for delegation API authentication
-    service_token = security.get_service_token()
-    if not service_token:
+    headers = _service_auth_headers()
+    if headers is None:
         raise RuntimeError("Service token not available - cannot validate delegation")
 
-    headers = {"Authorization": f"Bearer {service_token.strip()}"}
-    url = f"{_DELEGATION_API_BASE_URL.rstrip('/')}/v1/delegations/validate"
+    url = _DELEGATION_VALIDATE_URL
 
     params: dict[str, str] = {
         "principal_id": owner_id,
@@ -377,23 +632,34 @@ def compute_delegation_chain(
         params["workflow_id"] = workflow_id
 
     try:
-        data = http_get_json(url=url, params=params, headers=headers)
+        data = http_get_json(url=url, params=params, headers=headers, timeout_seconds=_PIP_TIMEOUTS)
         delegation_chain = data.get("delegation_chain", [])
         delegated_actions = data.get("delegated_actions", [])
 
-        # Return delegation data - let OPA decide if permissions are sufficient
-        return {
-            "delegation_chain": delegation_chain,
-            "delegated_actions": delegated_actions,
-        }
     except RuntimeError as e:
         raise RuntimeError(f"Failed to validate delegation chain: {e}") from e
 
+    # Return delegation data - let OPA decide if permissions are sufficient
+    delegation = {
+        "delegation_chain": delegation_chain,
+        "delegated_actions": delegated_actions,
+    }
+    _DELEGATION_CACHE.set(cache_key, delegation)
+    return delegation
+
 
 # ============================================================================
 # OPA Input Builder Functions
 # ============================================================================
 
+def _stripped_non_empty(value: Any) -> str | None:
+    # Stripped string if value is a non-blank str, else None.
+    # One type check + one strip (str.strip returns the same object when already clean).
+    if type(value) is not str:
+        return None
+    return value.strip() or None
+
+
 def build_opa_subject(authzen_request: dict[str, Any]) -> dict[str, Any]:
     """Build and validate OPA subject from AuthZEN request.
     
@@ -413,17 +679,16 @@ def build_opa_subject(authzen_request: dict[str, Any]) -> dict[str, Any]:
         raise ValueError("Request must be AuthZEN compliant: subject is required")
     
     # Validate and extract subject.id
-    subject_id = request_subject.get("id")
-    if not subject_id or not isinstance(subject_id, str) or not subject_id.strip():
+    subject_id = _stripped_non_empty(request_subject.get("id"))
+    if subject_id is None:
         raise ValueError("Request must be AuthZEN compliant: subject.id is required")
-    subject_id = subject_id.strip()
     
     # Extract subject.type (optional, defaults to "user")
     subject_type = request_subject.get("type", "user")
     
     # Validate and extract subject.properties.persona (persona title - required for users, optional for agents)
     subject_properties = request_subject.get("properties", {})
-    if not isinstance(subject_properties, dict):
+    if type(subject_properties) is not dict:
         raise ValueError("Request must be AuthZEN compliant: subject.properties must be a dictionary")
     
     subject_persona = subject_properties.get("persona")
@@ -434,16 +699,14 @@ def build_opa_subject(authzen_request: dict[str, Any]) -> dict[str, Any]:
         if not subject_persona:
             raise ValueError("Request must contain subject.properties.persona (persona title) for user subjects")
         
-        # Handle list format (take first element)
-        if isinstance(subject_persona, list):
-            if not subject_persona:
-                raise ValueError("Request must contain non-empty subject.properties.persona")
+        # Handle list format (take first element; the list is non-empty per the check above)
+        if type(subject_persona) is list:
             subject_persona = subject_persona[0]
         
         # Ensure persona title is a non-empty string
-        if not isinstance(subject_persona, str) or not subject_persona.strip():
+        subject_persona = _stripped_non_empty(subject_persona)
+        if subject_persona is None:
             raise ValueError("Request must contain a string for subject.properties.persona (persona title)")
-        subject_persona = subject_persona.strip()
     
     result = {
         "type": subject_type,
@@ -477,19 +740,24 @@ def build_opa_action(authzen_request: dict[str, Any]) -> dict[str, Any]:
     if not normalized_action or not isinstance(normalized_action, str) or not normalized_action.strip():
         raise ValueError("Request must be AuthZEN compliant: action.name is required")
     
-    normalized_action = security.sanitize_string(normalized_action.strip(), 255)
-    if normalized_action not in ALLOWED_ACTIONS:
-        raise ValueError(
-            f"Invalid action name: {normalized_action}. Allowed actions: {', '.join(sorted(ALLOWED_ACTIONS))}"
-        )
-    
-    return {"name": normalized_action}
+    normalized_action = normalized_action.strip()
+    if normalized_action in ALLOWED_ACTIONS:
+        # Whitelisted manifest action names are already safe - no sanitization needed
+        return {"name": normalized_action}
+
+    # Only untrusted (rejected) input is sanitized, for the error message
+    normalized_action = security.sanitize_string(normalized_action, 255)
+    raise ValueError(
+        f"Invalid action name: {normalized_action}. Allowed actions: {_ALLOWED_ACTIONS_STR}"
+    )
 
 
 def build_opa_resource(
     authzen_request: dict[str, Any],
-    persona_attributes: list[PolicyAttribute],
-    resource_attributes: list[PolicyAttribute],
+    persona_attributes: Sequence[PolicyAttribute],
+    resource_attributes: Sequence[PolicyAttribute],
+    *,
+    persona_attribute_names: frozenset[str] | None = None,
 ) -> dict[str, Any]:
     """Build OPA resource from AuthZEN request.
     
@@ -500,6 +768,8 @@ def build_opa_resource(
         authzen_request: AuthZEN-compliant request
         persona_attributes: Policy-specific persona attributes from manifest
         resource_attributes: Resource attributes from manifest
+        persona_attribute_names: Optional precomputed names of persona_attributes
+            (see _persona_attribute_names); derived from persona_attributes if omitted
     
     Returns:
         Resource dict with owner enriched with policy-specific persona attributes
@@ -509,24 +779,26 @@ def build_opa_resource(
         RuntimeError: If persona fetch fails
     """
     resource_from_request = authzen_request.get("resource") or {}
-    properties_from_request = coerce_dict(
-        resource_from_request.get("properties"), "resource.properties"
-    )
+    # Fast path: well-formed requests carry plain dicts; coerce_dict handles None/errors
+    properties_from_request = resource_from_request.get("properties")
+    if type(properties_from_request) is not dict:
+        properties_from_request = coerce_dict(properties_from_request, "resource.properties")
     
-    # Extract the original resource structure
-    resource = dict(resource_from_request)
+    # Shallow-copy only the properties level; nested dicts are shared and replaced
+    # (never mutated) when they change, so the caller's request is left untouched.
     enriched_properties = dict(properties_from_request)
     
     # Normalize resource attributes (default, validate, coerce)
     if resource_attributes:
+        # enriched_properties is already a private copy: normalize it in place
         enriched_properties = normalize_attributes(
-            enriched_properties, resource_attributes, "resource"
+            enriched_properties, resource_attributes, "resource", copy=False
         )
     
     # Extract the original owner information
-    owner_props = coerce_dict(
-        enriched_properties.get("owner"), "resource.properties.owner"
-    )
+    owner_props = enriched_properties.get("owner")
+    if type(owner_props) is not dict:
+        owner_props = coerce_dict(owner_props, "resource.properties.owner")
     owner_id = owner_props.get("id") if owner_props else None
     
     # Fetch owner's persona and augment resource.properties.owner
@@ -534,7 +806,6 @@ def build_opa_resource(
         owner_persona_id = owner_props.get("persona_id")
         owner_persona_title = owner_props.get("persona_title")  # Explicit persona title
         owner_persona_circle = owner_props.get("persona_circle")
-        workflow_id = enriched_properties.get("workflow_id") or resource_from_request.get("id")
         
         # Fetch owner's persona from persona-api (raises RuntimeError on failure)
         owner_persona = None
@@ -548,18 +819,22 @@ def build_opa_resource(
         # Augment owner with policy-specific attributes (NOT metadata)
         # IMPORTANT: Rename persona/circle to persona_title/persona_circle for OPA
         if owner_persona:
-            # Add policy-specific persona attributes to owner (e.g. autobook settings)
-            for attr in persona_attributes:
-                if attr.name in owner_persona:
-                    enriched_properties["owner"][attr.name] = owner_persona[attr.name]
+            # Add policy-specific persona attributes to owner (e.g. autobook settings).
+            # Copy-on-write: a new owner dict is built only when there is something to add.
+            if persona_attribute_names is None:
+                persona_attribute_names = frozenset(attr.name for attr in persona_attributes)
+            owner_persona_values = {
+                name: owner_persona[name]
+                for name in persona_attribute_names.intersection(owner_persona)
+            }
+            if owner_persona_values:
+                enriched_properties["owner"] = {**owner_props, **owner_persona_values}
         
         # Fields are already in correct format (persona_title, persona_circle)
         # No renaming needed
     
-    # Update resource with augmented properties
-    resource["properties"] = enriched_properties
-    
-    return resource
+    # Resource with augmented properties (other top-level keys shared with the request)
+    return {**resource_from_request, "properties": enriched_properties}
 
 
 def build_opa_context(
@@ -569,9 +844,10 @@ def build_opa_context(
     
     Logic flow:
     1. Extract and validate principal (REQUIRED - fail if missing/incomplete)
-    2. Enrich principal with persona metadata using persona_title + persona_circle
-    3. Extract owner from resource (may be None for CREATE actions)
-    4. Compute delegation if principal != owner
+    2. Extract owner from resource (may be None for CREATE actions)
+    3. Start delegation lookup if principal != owner (runs concurrently with step 4)
+    4. Enrich principal with persona metadata using persona_title + persona_circle
+    5. Collect the delegation result
     
     Args:
         authzen_request: AuthZEN-compliant request
@@ -598,7 +874,34 @@ def build_opa_context(
     if not principal_persona_title:
         raise RuntimeError("Principal must have a 'persona' title")
     
-    # Step 2: Enrich principal with persona metadata
+    # Step 2: Extract owner from resource (may be None for CREATE actions)
+    resource_from_request = authzen_request.get("resource") or {}
+    properties_from_request = resource_from_request.get("properties")
+    owner = properties_from_request.get("owner") if type(properties_from_request) is dict else None
+    
+    if type(owner) is dict:
+        owner_id = owner.get("id")
+        workflow_id = properties_from_request.get("workflow_id") or resource_from_request.get("id")
+    else:
+        owner_id = None
+        workflow_id = None
+
+    # Step 3: Start the delegation lookup (only if owner exists and principal != owner)
+    # why: the delegation-api and persona-api calls are independent, so the delegation
+    # lookup runs on the PIP pool while the principal persona is fetched below.
+    delegation_future = None
+    if owner_id and principal_id != owner_id:
+        # Principal is acting on behalf of owner - check for delegation
+        action_from_request = authzen_request.get("action", {}).get("name", "")
+        delegation_future = _PIP_POOL.submit(
+            compute_delegation_chain,
+            owner_id=str(owner_id),
+            principal_id=str(principal_id),
+            workflow_id=str(workflow_id) if workflow_id else None,
+            requested_action=action_from_request,
+        )
+
+    # Step 4: Enrich principal with persona metadata
     enriched_principal = dict(principal_from_request)
 
     principal_persona = fetch_persona_by_triplet(
@@ -618,39 +921,12 @@ def build_opa_context(
     
     # Fields are already in correct format (persona_title, persona_circle)
     # No renaming needed
-    
-    # Step 3: Extract owner from resource (may be None for CREATE actions)
-    resource_from_request = authzen_request.get("resource") or {}
-    properties_from_request = resource_from_request.get("properties", {})
-    
-    owner = properties_from_request.get("owner")
-    
-    if isinstance(owner, dict):
-        owner_id = owner.get("id")
-        workflow_id = properties_from_request.get("workflow_id") or resource_from_request.get("id")
-    else:
-        owner_id = None
-        workflow_id = None
-   
-    # Step 4: Compute delegation (only if owner exists and principal != owner)
-    delegation = {
-        "delegation_chain": [],
-        "delegated_actions": [],
-    }    
-    if owner_id and principal_id != owner_id:
-        # Principal is acting on behalf of owner - check for delegation
+
+    # Step 5: Collect the delegation result (shared empty value on the fast path)
+    delegation = _EMPTY_DELEGATION
+    if delegation_future is not None:
         try:
-            action_from_request = authzen_request.get("action", {}).get("name", "")
-            delegation_result = compute_delegation_chain(
-                owner_id=str(owner_id),
-                principal_id=str(principal_id),
-                workflow_id=str(workflow_id) if workflow_id else None,
-                requested_action=action_from_request,
-            )
-            delegation = {
-                "delegation_chain": delegation_result.get("delegation_chain", []),
-                "delegated_actions": delegation_result.get("delegated_actions", []),
-            }
+            delegation = delegation_future.result()
         except Exception:
             # Delegation fetch failed - continue with no delegation
             # This is acceptable as policy-check is done by opa
@@ -666,12 +942,48 @@ def build_opa_context(
 # Call the OPA PDP
 # ============================================================================
 
+# Short-lived cache of whole evaluate results, keyed by a hash of the canonical request.
+# why: UIs re-render and poll with identical AuthZEN requests; a hit skips the PIP
+# round-trips and OPA entirely. 5s default keeps decisions close to live policy/PIP state
+# (policies are hot-reloaded by OPA). EVALUATE_CACHE_TTL_SECONDS=0 disables the cache.
+_EVALUATE_CACHE_SIZE = int(os.environ.get("EVALUATE_CACHE_SIZE", "20000"))
+_EVALUATE_CACHE_TTL_SECONDS = int(os.environ.get("EVALUATE_CACHE_TTL_SECONDS", "5"))
+_EVALUATE_CACHE = (
+    TTLCache(maxsize=_EVALUATE_CACHE_SIZE, ttl_seconds=_EVALUATE_CACHE_TTL_SECONDS)
+    if _EVALUATE_CACHE_TTL_SECONDS > 0
+    else None
+)
+
+# OPA decision cache keyed by (policy name, hash of the canonical OPA input document).
+# Hits whenever the enriched input matches, even if the raw requests differ. 10s default;
+# OPA_DECISION_CACHE_TTL_SECONDS=0 disables it.
+_OPA_DECISION_CACHE_SIZE = int(os.environ.get("OPA_DECISION_CACHE_SIZE", "50000"))
+_OPA_DECISION_CACHE_TTL_SECONDS = int(os.environ.get("OPA_DECISION_CACHE_TTL_SECONDS", "10"))
+_OPA_DECISION_CACHE = (
+    TTLCache(maxsize=_OPA_DECISION_CACHE_SIZE, ttl_seconds=_OPA_DECISION_CACHE_TTL_SECONDS)
+    if _OPA_DECISION_CACHE_TTL_SECONDS > 0
+    else None
+)
+
+# Denials caused by transient upstream failures; never cached so the next call retries
+_UNCACHEABLE_REASON_CODES = frozenset(_REASONS_PERSONA_FETCH_FAILED + _REASONS_SYSTEM_ERROR)
+
+
+def clear_evaluate_cache() -> None:
+    # Drop all cached evaluate results and OPA decisions (tests, policy changes that must apply immediately)
+    if _EVALUATE_CACHE is not None:
+        _EVALUATE_CACHE.clear()
+    if _OPA_DECISION_CACHE is not None:
+        _OPA_DECISION_CACHE.clear()
+
+
 def evaluate_authorization_request(
     authzen_request: dict[str, Any],
 ) -> EvaluateResult:
     """Evaluate an authorization request end-to-end.
     
     Uses focused builder functions to construct OPA input and evaluates with OPA.
+    Identical requests within EVALUATE_CACHE_TTL_SECONDS are answered from cache.
     
     Args:
         authzen_request: AuthZEN-compliant request body
@@ -682,71 +994,88 @@ def evaluate_authorization_request(
     Raises:
         ValueError: If request is invalid or policy selection fails
     """
+    if _EVALUATE_CACHE is None:
+        return _evaluate_authorization_request_uncached(authzen_request)
+
+    cache_key = hashlib.blake2b(
+        json_dumps_canonical_bytes(authzen_request), digest_size=16
+    ).digest()
+    cached_result = _EVALUATE_CACHE.get(cache_key)
+    if cached_result is not None:
+        return cached_result
+
+    result = _evaluate_authorization_request_uncached(authzen_request)
+    if _UNCACHEABLE_REASON_CODES.isdisjoint(result.reason_codes):
+        _EVALUATE_CACHE.set(cache_key, result)
+    return result
+
+
+def _evaluate_authorization_request_uncached(
+    authzen_request: dict[str, Any],
+) -> EvaluateResult:
+    # Full evaluation: policy selection, OPA input builders (PIP fetches), OPA query
 
     # Select policy based on required policy_hint
-    try:
-        selected_policy = _POLICY_REGISTRY.select_policy(
-            policy_hint=authzen_request.get("context", {}).get("policy_hint"),
-        )
-    except ValueError as e:
-        raise ValueError(f"Policy selection failed: {e}") from e
+    # Fast path: a known hint is one dict hit; missing/unknown hints go through the
+    # registry for its error messages.
+    policy_hint = (authzen_request.get("context") or {}).get("policy_hint")
+    selected_policy = _POLICIES_BY_HINT.get(policy_hint) if type(policy_hint) is str else None
+    if selected_policy is None:
+        try:
+            selected_policy = _POLICY_REGISTRY.select_policy(policy_hint=policy_hint)
+        except ValueError as e:
+            raise ValueError(f"Policy selection failed: {e}") from e
 
     # 1. Build and validate subject for OPA policy
     try:
         subject = build_opa_subject(authzen_request)
     except ValueError as e:
         # Invalid or missing subject fields
-        return EvaluateResult(
-            decision="deny",
-            reason_codes=["authz.invalid_subject"],
-            advice=[{"message": str(e)}],
-        )
+        return _deny(_REASONS_INVALID_SUBJECT, str(e))
     
     # 2. Build and validate action for OPA policy
     try:
         action = build_opa_action(authzen_request)
     except ValueError as e:
         # Invalid action name or missing action
-        return EvaluateResult(
-            decision="deny",
-            reason_codes=["authz.invalid_action"],
-            advice=[{"message": str(e)}],
-        )
-    
-    # 3. Build and validate resource for OPA policy
+        return _deny(_REASONS_INVALID_ACTION, str(e))
+    
+    # 3./4. Build resource and context concurrently
+    # why: the owner persona (resource), principal persona and delegation chain (context)
+    # are independent PIP round-trips. The resource build runs on the PIP pool while the
+    # context is built on this thread (which itself offloads the delegation lookup), so
+    # wall time is ~max(RTT) instead of the sum.
+    # assumptions: build_opa_resource never submits to _PIP_POOL itself, so a saturated
+    # pool cannot deadlock on nested futures.
+    # side effects: error precedence is unchanged - resource errors are reported first.
+    resource_future = _PIP_POOL.submit(
+        build_opa_resource,
+        authzen_request,
+        selected_policy.persona_attributes,
+        selected_policy.resource_attributes,
+        persona_attribute_names=_persona_attribute_names(selected_policy.name),
+    )
+
+    context_error: RuntimeError | None = None
     try:
-        resource = build_opa_resource(
+        context = build_opa_context(
             authzen_request,
-            selected_policy.persona_attributes,
-            selected_policy.resource_attributes,
         )
+    except RuntimeError as e:
+        context_error = e
+
+    try:
+        resource = resource_future.result()
     except ValueError as e:
         # Validation error (missing required attributes, etc.)
-        return EvaluateResult(
-            decision="deny",
-            reason_codes=["authz.missing_required_attributes"],
-            advice=[{"message": str(e)}],
-        )
+        return _deny(_REASONS_MISSING_REQUIRED_ATTRIBUTES, str(e))
     except RuntimeError as e:
         # Persona API failure - return denial with system error
-        return EvaluateResult(
-            decision="deny",
-            reason_codes=["authz.persona_fetch_failed"],
-            advice=[{"message": f"Failed to fetch owner persona: {str(e)}"}],
-        )
+        return _deny(_REASONS_PERSONA_FETCH_FAILED, f"Failed to fetch owner persona: {str(e)}")
     
-    # 4. Build and validate context for OPA policy
-    try:
-        context = build_opa_context(
-            authzen_request,
-        )
-    except RuntimeError as e:
+    if context_error is not None:
         # Persona or delegation API failure - return denial with system error
-        return EvaluateResult(
-            decision="deny",
-            reason_codes=["authz.system_error"],
-            advice=[{"message": f"Failed to build context: {str(e)}"}],
-        )
+        return _deny(_REASONS_SYSTEM_ERROR, f"Failed to build context: {str(context_error)}")
     
     # Evaluate with OPA
     opa_authzen = {
@@ -756,12 +1085,22 @@ def evaluate_authorization_request(
         "context": context,
     }
     
-    opa_client = _build_opa_client_for_policy(selected_policy)
-    is_allowed = opa_client.evaluate_allow(input_document=opa_authzen)
-    reasons = opa_client.evaluate_reasons(input_document=opa_authzen)
+    # Content-addressed decision cache: the OPA input is what the policy sees, so equal
+    # inputs reuse a decision even when the AuthZEN envelope around them differed.
+    decision_key = None
+    if _OPA_DECISION_CACHE is not None:
+        decision_key = (
+            selected_policy.name,
+            hashlib.blake2b(json_dumps_canonical_bytes(opa_authzen), digest_size=16).digest(),
+        )
+        cached_decision = _OPA_DECISION_CACHE.get(decision_key)
+        if cached_decision is not None:
+            is_allowed, reasons = cached_decision
+            return _decision(is_allowed, reasons)
+
+    opa_client = _opa_client_for_policy_name(selected_policy.name)
+    is_allowed, reasons = opa_client.evaluate(input_document=opa_authzen)
+    if decision_key is not None:
+        _OPA_DECISION_CACHE.set(decision_key, (is_allowed, reasons))
     
-    return EvaluateResult(
-        decision="allow" if is_allowed else "deny",
-        reason_codes=reasons,
-        advice=[],
-    )
+    return _decision(is_allowed, reasons)
@@ -96,18 +96,24 @@ import time
 from typing import Any, Optional
 
 import api_logging
+import jwt
 import security
 import uvicorn
 from authz_core import evaluate_authorization_request
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from fastapi import Body, Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from jose import jwt
+from fastapi.responses import JSONResponse, ORJSONResponse
+from utils import ORJSON_AVAILABLE
 
 # ============================================================================
 # Configuration Constants
 # ============================================================================
 
+# Serialize responses with orjson when installed (falls back to stdlib json)
+JSON_RESPONSE_CLASS = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
 # Environment flag for detailed error messages (disable in production)
 INCLUDE_ERROR_DETAILS = os.environ.get("INCLUDE_ERROR_DETAILS", "1") == "1"
 
@@ -118,15 +124,20 @@ FLOWPILOT_TOKEN_ISSUER = os.environ.get("FLOWPILOT_TOKEN_ISSUER", "https://flowp
 FLOWPILOT_TOKEN_AUDIENCE = os.environ.get("FLOWPILOT_TOKEN_AUDIENCE", "flowpilot")
 FLOWPILOT_TOKEN_EXPIRY_SECONDS = int(os.environ.get("FLOWPILOT_TOKEN_EXPIRY_SECONDS", "900"))  # 15 minutes
 
-# Cached signing key
-_SIGNING_KEY: str | None = None
+# Cached signing key (parsed once; RSA PEM deserialization is far costlier than signing)
+_SIGNING_KEY: RSAPrivateKey | None = None
 _SIGNING_KEY_ID = "flowpilot-v1"
+_SIGNING_HEADERS = {"kid": _SIGNING_KEY_ID}
 
 # ============================================================================
 # FastAPI Application
 # ============================================================================
 
-app = FastAPI(title="FlowPilot AuthZ API", version="1.0.0")
+app = FastAPI(
+    title="FlowPilot AuthZ API",
+    version="1.0.0",
+    default_response_class=JSON_RESPONSE_CLASS,
+)
 
 # Add CORS middleware
 cors_config = security.get_cors_config()
@@ -182,28 +193,27 @@ def build_error_response(
     return JSONResponse(status_code=status_code, content=body)
 
 
-def _get_signing_key() -> str:
-    """Load FlowPilot signing key from file system or environment variable (cached)."""
+def _get_signing_key() -> RSAPrivateKey:
+    """Load and parse the FlowPilot signing key from environment or file system (cached)."""
     global _SIGNING_KEY
-    if _SIGNING_KEY:
+    if _SIGNING_KEY is not None:
         return _SIGNING_KEY
 
     # First try environment variable (for Cloud Run secret mounting)
-    env_key = os.environ.get("SIGNING_KEY_CONTENT")
-    if env_key:
-        _SIGNING_KEY = env_key
-        return _SIGNING_KEY
-
-    # Fall back to file system (for local development)
-    try:
-        with open(SIGNING_KEY_PATH) as f:
-            _SIGNING_KEY = f.read()
-        return _SIGNING_KEY
-    except FileNotFoundError:
-        raise HTTPException(
-            status_code=500,
-            detail="Token signing key not configured (neither SIGNING_KEY_CONTENT env var nor file at SIGNING_KEY_PATH)"
-        )
+    pem = os.environ.get("SIGNING_KEY_CONTENT")
+    if not pem:
+        # Fall back to file system (for local development)
+        try:
+            with open(SIGNING_KEY_PATH) as f:
+                pem = f.read()
+        except FileNotFoundError:
+            raise HTTPException(
+                status_code=500,
+                detail="Token signing key not configured (neither SIGNING_KEY_CONTENT env var nor file at SIGNING_KEY_PATH)"
+            )
+
+    _SIGNING_KEY = load_pem_private_key(pem.encode("utf-8"), password=None)
+    return _SIGNING_KEY
 
 
 @app.get("/health")
@@ -263,7 +273,7 @@ def post_token_exchange(
         access_token_payload,
         signing_key,
         algorithm="RS256",
-        headers={"kid": _SIGNING_KEY_ID}
+        headers=_SIGNING_HEADERS,
     )
 
     return {
@@ -279,9 +289,9 @@ def post_evaluate(
     request_body: dict[str, Any] = Body(...),
     token_claims: dict[str, Any] = Depends(security.verify_token),
 ) -> dict[str, Any]:
-    # Sanitize all input before processing
+    # Validate all input before processing (read-only: evaluation never mutates the body)
     try:
-        sanitized_body = security.sanitize_request_json_payload(request_body)
+        sanitized_body = security.validate_request_json_payload(request_body)
     except security.InputValidationError as exc:
         error_detail = security.sanitize_error_message(str(exc), INCLUDE_ERROR_DETAILS)
         raise HTTPException(status_code=400, detail=error_detail) from exc
@@ -7,6 +7,9 @@
 # Manifest files are YAML documents located in the policy directory structure:
 #   {POLICY_MANIFEST_DIR}/{policy_name}/manifest.yaml
 #
+# A manifest.json with the same structure may sit next to (or replace) manifest.yaml;
+# when present it takes precedence, since JSON parses much faster than YAML.
+#
 # Example manifest:
 #   name: travel
 #   package: auto_book
@@ -18,17 +21,36 @@
 
 from __future__ import annotations
 
+import json
 import os
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, List
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, List, NamedTuple
 
 import yaml
 
+# Import orjson (optional - falls back to stdlib json if not available)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Prefer the libyaml C loader (same safe semantics and YAMLError hierarchy); pure-Python fallback
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Read buffer for streamed YAML manifests (default io buffer is 8 KiB)
+_MANIFEST_READ_BUFFER_SIZE = 128 * 1024
+
 
-@dataclass(frozen=True)
-class PolicyAttribute:
-    """Represents a typed attribute requirement with defaults and validation."""
+class PolicyAttribute(NamedTuple):
+    """Represents a typed attribute requirement with defaults and validation.
+
+    A NamedTuple: immutable and compact, with field access, comparison and hashing done
+    in C. Fields are validated by load_policy_manifest before construction.
+    """
     name: str
     type: str  # "string", "integer", "float", "boolean", "date"
     source: str  # "persona" | "resource" - where the attribute comes from
@@ -37,14 +59,18 @@ class PolicyAttribute:
     required: bool = False  # Whether attribute must be present (overrides default)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PolicyManifest:
     """Represents a policy manifest with package and attribute requirements."""
 
     name: str  # Policy identifier (e.g., "travel", "nursing")
     package: str  # OPA package name (e.g., "auto_book", "nursing_care")
-    attributes: list[PolicyAttribute]  # All required attributes (unified list with source field)
+    attributes: tuple[PolicyAttribute, ...]  # All required attributes (unified, with source field)
     persona_config: dict[str, Any] = None  # Persona configuration (allowed titles, delegation rules)
+    # Derived in __post_init__ (slots: must be declared)
+    _persona_attributes: tuple[PolicyAttribute, ...] = field(init=False, repr=False, compare=False, default=())
+    _resource_attributes: tuple[PolicyAttribute, ...] = field(init=False, repr=False, compare=False, default=())
+    _allowed_actions: frozenset[str] = field(init=False, repr=False, compare=False, default=frozenset())
 
     def __post_init__(self):
         """Validate manifest fields."""
@@ -52,24 +78,41 @@ class PolicyManifest:
             raise ValueError(f"Policy manifest 'name' must be a non-empty string, got: {self.name}")
         if not isinstance(self.package, str):
             raise ValueError(f"Policy manifest 'package' must be a non-empty string, got: {self.package}")
-        if not isinstance(self.attributes, list):
+        if not isinstance(self.attributes, (list, tuple)):
             raise ValueError("Policy manifest 'attributes' must be a list")
         if not all(isinstance(attr, PolicyAttribute) for attr in self.attributes):
             raise ValueError("Policy manifest 'attributes' must be PolicyAttribute objects")
 
+        # Frozen after load: store attributes as a tuple and split by source once, so the
+        # per-request accessors below are O(1)
+        attributes = tuple(self.attributes)
+        object.__setattr__(self, "attributes", attributes)
+        object.__setattr__(
+            self, "_persona_attributes", tuple(attr for attr in attributes if attr.source == "persona")
+        )
+        object.__setattr__(
+            self, "_resource_attributes", tuple(attr for attr in attributes if attr.source == "resource")
+        )
+        object.__setattr__(self, "_allowed_actions", _collect_allowed_actions(self.persona_config))
+
     @property
-    def persona_attributes(self) -> list[PolicyAttribute]:
+    def persona_attributes(self) -> tuple[PolicyAttribute, ...]:
         """Get persona attributes (for backward compatibility)."""
-        return [attr for attr in self.attributes if attr.source == "persona"]
+        return self._persona_attributes
 
     @property
-    def resource_attributes(self) -> list[PolicyAttribute]:
+    def resource_attributes(self) -> tuple[PolicyAttribute, ...]:
         """Get resource attributes (for backward compatibility)."""
-        return [attr for attr in self.attributes if attr.source == "resource"]
+        return self._resource_attributes
+
+    @property
+    def allowed_actions(self) -> frozenset[str]:
+        """Get the allowed-actions of every persona title in persona_config."""
+        return self._allowed_actions
 
 
 def load_policy_manifest(policy_name: str, manifest_dir: str) -> PolicyManifest:
-    """Load policy manifest from YAML file.
+    """Load policy manifest from manifest.json (preferred, if present) or manifest.yaml.
     
     Args:
         policy_name: Policy identifier (e.g., "travel")
@@ -83,22 +126,56 @@ def load_policy_manifest(policy_name: str, manifest_dir: str) -> PolicyManifest:
         ValueError: If manifest is invalid or malformed
         yaml.YAMLError: If manifest cannot be parsed
     """
-    manifest_path = Path(manifest_dir) / policy_name / "manifest.yaml"
-
-    if not manifest_path.exists():
+    # Plain string paths (os.fspath also accepts a Path manifest_dir): no Path objects per call
+    policy_dir = os.path.join(os.fspath(manifest_dir), policy_name)
+
+    # One stat per candidate doubles as the existence check and the parse-cache key
+    for manifest_filename in ("manifest.json", "manifest.yaml"):
+        manifest_path = os.path.join(policy_dir, manifest_filename)
+        try:
+            manifest_stat = os.stat(manifest_path)
+            break
+        except FileNotFoundError:
+            continue
+    else:
         raise FileNotFoundError(
             f"Policy manifest not found: {manifest_path}. "
             f"Expected structure: {manifest_dir}/{policy_name}/manifest.yaml"
         )
 
-    try:
-        with open(manifest_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise ValueError(f"Failed to parse policy manifest {manifest_path}: {e}") from e
+    return _load_policy_manifest_cached(
+        manifest_path, policy_name, manifest_stat.st_mtime_ns, manifest_stat.st_size
+    )
+
+
+@lru_cache(maxsize=256)
+def _load_policy_manifest_cached(
+    manifest_path: str, policy_name: str, mtime_ns: int, size: int
+) -> PolicyManifest:
+    # Parse + validate one manifest file, memoized by (path, policy, mtime_ns, size)
+    # why: registries rebuilt for unchanged files (tests, reloads) skip the YAML parse and
+    # validation; any edit changes mtime/size and therefore the key.
+    # assumptions: PolicyManifest is treated as immutable by all callers.
+    # side effects: file I/O on cache miss; failures are not cached.
+    if manifest_path.endswith(".json"):
+        try:
+            with open(manifest_path, "rb") as f:
+                raw_manifest = f.read()
+            data = orjson.loads(raw_manifest) if ORJSON_AVAILABLE else json.loads(raw_manifest)
+        except ValueError as e:
+            # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
+            raise ValueError(f"Failed to parse policy manifest {manifest_path}: {e}") from e
+    else:
+        try:
+            # Streamed from the handle (no intermediate full-file string); the larger buffer
+            # batches the loader's chunked reads into fewer syscalls on slow/network mounts
+            with open(manifest_path, encoding="utf-8", buffering=_MANIFEST_READ_BUFFER_SIZE) as f:
+                data = yaml.load(f, Loader=_YAML_LOADER)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Failed to parse policy manifest {manifest_path}: {e}") from e
 
     if not isinstance(data, dict):
-        raise ValueError(f"Policy manifest must be a YAML dictionary, got: {type(data)}")
+        raise ValueError(f"Policy manifest must be a YAML/JSON dictionary, got: {type(data)}")
 
     # Extract required fields
     name = data.get("name")
@@ -141,6 +218,11 @@ def load_policy_manifest(policy_name: str, manifest_dir: str) -> PolicyManifest:
                 f"Attribute '{attr_name}' missing or invalid 'source' field "
                 f"(must be 'persona' or 'resource'): {attr_def}"
             )
+        # Small closed vocabularies: intern so every manifest shares one string object
+        # and source/type comparisons hit the identity fast path
+        attr_source = sys.intern(attr_source)
+        if isinstance(attr_type, str):
+            attr_type = sys.intern(attr_type)
 
         attr_default = attr_def.get("default")
         attr_description = attr_def.get("description", "")
@@ -178,35 +260,76 @@ def load_policy_manifest(policy_name: str, manifest_dir: str) -> PolicyManifest:
 class PolicyRegistry:
     """Registry for managing multiple policy manifests."""
 
-    def __init__(self, manifest_dir: str):
-        """Initialize registry by loading all policies from directory.
+    def __init__(self, manifest_dir: str, eager: bool = True):
+        """Initialize registry for the policies in a directory.
         
         Args:
             manifest_dir: Base directory containing policy subdirectories
+            eager: Load and validate every manifest now (default). With eager=False only
+                the directory is scanned; each manifest is loaded on first use and kept.
         """
         self.manifest_dir = manifest_dir
+        # Loaded manifests (all of them when eager, the ones used so far otherwise)
         self.policies: dict[str, PolicyManifest] = {}
-        self._load_all_policies()
+        self._set_policy_names(self._scan_policy_names())
+        self._all_allowed_actions: frozenset[str] | None = None
+
+        if eager:
+            self._load_all_policies()
+
+    def _set_policy_names(self, policy_names: list[str]) -> None:
+        """Fix the known policy names, with their membership set and error-message string."""
+        # Names only change when a lazy lookup finds a directory without a manifest, so the
+        # membership set and the "Available: ..." string are rebuilt only then, not per miss
+        self._policy_names: tuple[str, ...] = tuple(policy_names)
+        self._policy_name_set: frozenset[str] = frozenset(policy_names)
+        self._available_str = ", ".join(policy_names)
+
+    def _scan_policy_names(self) -> list[str]:
+        """List candidate policy names: subdirectories of manifest_dir, in directory order."""
+        # Single scandir pass (DirEntry.is_dir uses the d_type from readdir; symlinked dirs,
+        # e.g. Kubernetes ConfigMap mounts, are still followed). Hidden and dunder entries
+        # (.git, __pycache__, ConfigMap ..data links) are skipped by name before any stat.
+        # Subdirectories without a manifest are dropped when loading reports FileNotFoundError.
+        try:
+            with os.scandir(self.manifest_dir) as entries:
+                return [
+                    entry.name
+                    for entry in entries
+                    if not entry.name.startswith((".", "__")) and entry.is_dir()
+                ]
+        except FileNotFoundError:
+            raise RuntimeError(f"Policy manifest directory not found: {self.manifest_dir}") from None
 
     def _load_all_policies(self) -> None:
         """Load all policy manifests from the directory."""
-        manifest_path = Path(self.manifest_dir)
-        if not manifest_path.exists():
-            raise RuntimeError(f"Policy manifest directory not found: {self.manifest_dir}")
+        policy_names = self._policy_names
 
-        # Find all subdirectories with manifest.yaml
+        # Load manifests concurrently (independent file read + parse per policy); results
+        # are collected in directory order so registry order and error order are stable.
         policy_errors = []
-        for policy_dir in manifest_path.iterdir():
-            if policy_dir.is_dir():
-                manifest_file = policy_dir / "manifest.yaml"
-                if manifest_file.exists():
+        if policy_names:
+            with ThreadPoolExecutor(max_workers=min(32, len(policy_names))) as executor:
+                futures = [
+                    (policy_name, executor.submit(load_policy_manifest, policy_name, self.manifest_dir))
+                    for policy_name in policy_names
+                ]
+                for policy_name, future in futures:
                     try:
-                        policy_name = policy_dir.name
-                        manifest = load_policy_manifest(policy_name, self.manifest_dir)
-                        self.policies[policy_name] = manifest
+                        self.policies[policy_name] = future.result()
+                    except FileNotFoundError:
+                        # Not a policy directory (no manifest.yaml)
+                        continue
                     except Exception as e:
                         # Collect errors instead of silently continuing
-                        policy_errors.append(f"Failed to load policy '{policy_dir.name}': {e}")
+                        policy_errors.append(f"Failed to load policy '{policy_name}': {e}")
+
+        # Every policy is loaded: the name list is exactly the loaded set from here on,
+        # and the registry-wide action set can be fixed now
+        self._set_policy_names(list(self.policies))
+        self._all_allowed_actions = frozenset().union(
+            *(policy.allowed_actions for policy in self.policies.values())
+        )
 
         if not self.policies:
             error_details = "\n".join(policy_errors) if policy_errors else "No manifest.yaml files found"
@@ -221,6 +344,22 @@ class PolicyRegistry:
 
         print(f"Loaded {len(self.policies)} policies: {', '.join(self.policies.keys())}", flush=True)
 
+    def _get_or_load(self, policy_name: str) -> PolicyManifest | None:
+        """Return a loaded manifest, loading it on first use; None if there is no such policy."""
+        policy = self.policies.get(policy_name)
+        if policy is not None or policy_name not in self._policy_name_set:
+            return policy
+        try:
+            policy = load_policy_manifest(policy_name, self.manifest_dir)
+        except FileNotFoundError:
+            # Subdirectory without a manifest: not a policy
+            self._set_policy_names([name for name in self._policy_names if name != policy_name])
+            return None
+        # Concurrent first loads may both get here; load_policy_manifest is memoized,
+        # so both store the same manifest object.
+        self.policies[policy_name] = policy
+        return policy
+
     def select_policy(
         self,
         policy_hint: str,
@@ -237,19 +376,20 @@ class PolicyRegistry:
             ValueError: If policy_hint is missing or policy not found
         """
         if not policy_hint:
-            available = ", ".join(self.policies.keys())
+            available = self._available_str
             raise ValueError(
                 f"Policy selection requires context.policy_hint. "
                 f"Available policies: {available}"
             )
         
-        if policy_hint not in self.policies:
-            available = ", ".join(self.policies.keys())
+        policy = self._get_or_load(policy_hint)
+        if policy is None:
+            available = self._available_str
             raise ValueError(
                 f"Policy '{policy_hint}' not found. Available policies: {available}"
             )
         
-        return self.policies[policy_hint]
+        return policy
 
     def get_policy_by_name(self, policy_name: str) -> PolicyManifest:
         """Get policy manifest by name.
@@ -263,37 +403,60 @@ class PolicyRegistry:
         Raises:
             ValueError: If policy not found
         """
-        if policy_name not in self.policies:
-            available = ", ".join(self.policies.keys())
+        policy = self._get_or_load(policy_name)
+        if policy is None:
+            available = self._available_str
             raise ValueError(f"Policy '{policy_name}' not found. Available: {available}")
-        return self.policies[policy_name]
+        return policy
 
     def list_policies(self) -> list[str]:
-        """List all available policy names."""
-        return list(self.policies.keys())
+        """List all available policy names (without loading their manifests)."""
+        return list(self._policy_names)
+
+    def get_allowed_actions(self, policy_name: str) -> frozenset[str]:
+        """Get allowed actions for a single policy (precomputed on the manifest).
+        
+        Args:
+            policy_name: Name of the policy
+        
+        Returns:
+            Frozenset of allowed action names for the policy
+        
+        Raises:
+            ValueError: If policy not found
+        """
+        return self.get_policy_by_name(policy_name).allowed_actions
 
-    def get_all_allowed_actions(self) -> set[str]:
-        """Get all allowed actions across all loaded policies.
+    def get_all_allowed_actions(self) -> frozenset[str]:
+        """Get all allowed actions across all policies.
         
         Collects unique actions from:
         - All persona_titles.allowed-actions in persona_config
         - Standard CRUD actions (if any personas exist)
         
         Returns:
-            Set of all allowed action names
+            Frozenset of all allowed action names (precomputed at eager load; a lazy
+            registry computes it once on first call, loading every policy)
         """
-        actions = set()
-        
-        for policy in self.policies.values():
-            if policy.persona_config:
-                persona_titles = policy.persona_config.get("persona_titles", [])
-                for persona_def in persona_titles:
-                    if isinstance(persona_def, dict):
-                        allowed = persona_def.get("allowed-actions", [])
-                        if isinstance(allowed, list):
-                            actions.update(allowed)
-        
-        return actions
+        if self._all_allowed_actions is None:
+            policies = [self._get_or_load(policy_name) for policy_name in self._policy_names]
+            self._all_allowed_actions = frozenset().union(
+                *(policy.allowed_actions for policy in policies if policy is not None)
+            )
+        return self._all_allowed_actions
+
+
+def _collect_allowed_actions(persona_config: dict[str, Any] | None) -> frozenset[str]:
+    """Collect the allowed-actions of every persona title in a policy's persona_config."""
+    actions: set[str] = set()
+    if persona_config:
+        persona_titles = persona_config.get("persona_titles", [])
+        for persona_def in persona_titles:
+            if isinstance(persona_def, dict):
+                allowed = persona_def.get("allowed-actions", [])
+                if isinstance(allowed, list):
+                    actions.update(allowed)
+    return frozenset(actions)
 
 
 def get_policy_manifest_from_env() -> PolicyManifest:
@@ -8,19 +8,117 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import sys
+import time
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from graphdb import DelegationGraphDB
-from utils import read_env_string, require_non_empty_string
+from utils import TTLCache, read_env_int, read_env_string, require_non_empty_string
 
 # Delegation allowed actions configuration (required environment variable, comma-separated)
 _DELEGATION_ALLOWED_ACTIONS_STR = read_env_string("DELEGATION_ALLOWED_ACTIONS")
-DELEGATION_ALLOWED_ACTIONS = {
-    action.strip()
+# Closed action vocabulary, fixed for the process lifetime: frozenset of interned strings
+DELEGATION_ALLOWED_ACTIONS = frozenset(
+    sys.intern(action.strip())
     for action in _DELEGATION_ALLOWED_ACTIONS_STR.split(",")
     if action.strip()
-}
+)
+
+# Shared, immutable forms reused on every call instead of being rebuilt per request
+_DELEGATION_ALLOWED_ACTIONS_LIST = tuple(sorted(DELEGATION_ALLOWED_ACTIONS))
+_DEFAULT_SCOPE = frozenset({"execute"})
+
+# Action bitmasks over the closed vocabulary: one bit per allowed action, so a subset
+# check is a single AND + compare. Actions outside the vocabulary map to a reserved bit
+# that no delegator mask ever carries, so requesting one can never pass the check.
+_ACTION_BITS = {action: 1 << index for index, action in enumerate(_DELEGATION_ALLOWED_ACTIONS_LIST)}
+_UNKNOWN_ACTION_BIT = 1 << len(_ACTION_BITS)
+
+# Expiry arithmetic for create_delegation (epoch seconds, formatted in UTC)
+_SECONDS_PER_DAY = 86400
+_UTC = timezone.utc
+
+# Delegator permission cache for create_delegation (optional environment variables)
+# Keyed by (principal_id, delegator_id, workflow_id) -> bitmask of delegated actions.
+# Only positive validations are cached and a cache hit can only *allow* a request; any
+# revocation clears the cache, and the TTL bounds staleness across instances.
+DELEGATOR_ACTIONS_CACHE_SIZE = read_env_int("DELEGATOR_ACTIONS_CACHE_SIZE", 4096)
+DELEGATOR_ACTIONS_CACHE_TTL_SECONDS = read_env_int("DELEGATOR_ACTIONS_CACHE_TTL_SECONDS", 30)
+
+# validate_delegation result cache (optional environment variables; TTL 0 disables)
+# Keyed by (principal_id, delegate_id, workflow_id) after normalization. Any local create or
+# revoke clears it (a new or removed edge can change any transitive chain); the TTL bounds
+# staleness for writes made through other instances.
+VALIDATION_CACHE_SIZE = read_env_int("VALIDATION_CACHE_SIZE", 50000)
+VALIDATION_CACHE_TTL_SECONDS = read_env_int("VALIDATION_CACHE_TTL_SECONDS", 30)
+
+
+def _actions_mask(actions: Any) -> int:
+    # Fold an iterable of action names into a bitmask over _ACTION_BITS.
+    mask = 0
+    for action in actions:
+        mask |= _ACTION_BITS.get(action, _UNKNOWN_ACTION_BIT)
+    return mask
+
+
+def _actions_from_mask(mask: int) -> list[str]:
+    # Expand a delegator mask back into action names (error messages only).
+    return [action for action, bit in _ACTION_BITS.items() if mask & bit]
+
+
+_DEFAULT_SCOPE_MASK = _actions_mask(_DEFAULT_SCOPE)
+
+
+def _is_normalized_id(value: Any) -> bool:
+    # True when require_non_empty_string would return value unchanged.
+    return type(value) is str and bool(value) and not value[0].isspace() and not value[-1].isspace()
+
+
+def _normalize_id(value: Any, field_name: str) -> str:
+    # require_non_empty_string, skipped when the id is already normalized (the usual case:
+    # ids arrive stripped from the API models or from an earlier service call).
+    if _is_normalized_id(value):
+        return value
+    return require_non_empty_string(value, field_name)
+
+
+def _validate_scope(scope: list[str] | None) -> None:
+    # Reject actions outside the closed vocabulary before any graph work is done.
+    if scope and not DELEGATION_ALLOWED_ACTIONS.issuperset(scope):
+        invalid_actions = sorted(set(scope) - DELEGATION_ALLOWED_ACTIONS)
+        raise ValueError(
+            f"Invalid action in scope: {', '.join(invalid_actions)}. "
+            f"Allowed: {list(_DELEGATION_ALLOWED_ACTIONS_LIST)}"
+        )
+
+
+def _validate_create_args(
+    principal_id: Any, delegate_id: Any, expires_in_days: int, scope: list[str] | None
+) -> tuple[str, str]:
+    # Per-delegation argument checks shared by create_delegation and the bulk pre-pass.
+    # Returns the normalized (principal_id, delegate_id).
+    principal_id = _normalize_id(principal_id, "principal_id")
+    delegate_id = _normalize_id(delegate_id, "delegate_id")
+
+    if principal_id == delegate_id:
+        raise ValueError("principal_id cannot be the same as delegate_id")
+
+    if expires_in_days <= 0:
+        raise ValueError("expires_in_days must be positive")
+
+    _validate_scope(scope)
+    return principal_id, delegate_id
+
+
+def _direct_match_result(principal_id: str) -> dict[str, Any]:
+    # Validation result for a principal acting on its own resources: full vocabulary,
+    # single-element chain (a tuple, serialized as a JSON array like the list it replaces).
+    return {
+        "valid": True,
+        "delegation_chain": (principal_id,),
+        "delegated_actions": _DELEGATION_ALLOWED_ACTIONS_LIST,
+    }
 
 
 class DelegationService:
@@ -32,6 +130,21 @@ class DelegationService:
         # Args:
         #     graphdb: Graph database instance
         self.graphdb = graphdb
+        self._delegator_actions_cache = TTLCache(
+            maxsize=DELEGATOR_ACTIONS_CACHE_SIZE,
+            ttl_seconds=DELEGATOR_ACTIONS_CACHE_TTL_SECONDS,
+        )
+        self._validation_cache = (
+            TTLCache(maxsize=VALIDATION_CACHE_SIZE, ttl_seconds=VALIDATION_CACHE_TTL_SECONDS)
+            if VALIDATION_CACHE_TTL_SECONDS > 0
+            else None
+        )
+
+    def _invalidate_validation_cache(self) -> None:
+        # Drop cached validations after a graph write: any edge can complete or cut a chain
+        # (including cached "invalid" results), so working out the affected keys is not attempted.
+        if self._validation_cache is not None:
+            self._validation_cache.clear()
 
     def create_delegation(
         self,
@@ -54,14 +167,9 @@ class DelegationService:
         #
         # Returns:
         #     Dictionary with delegation details
-        principal_id = require_non_empty_string(principal_id, "principal_id")
-        delegate_id = require_non_empty_string(delegate_id, "delegate_id")
-
-        if principal_id == delegate_id:
-            raise ValueError("principal_id cannot be the same as delegate_id")
-
-        if expires_in_days <= 0:
-            raise ValueError("expires_in_days must be positive")
+        principal_id, delegate_id = _validate_create_args(
+            principal_id, delegate_id, expires_in_days, scope
+        )
 
         # Validate that delegator can only delegate permissions they have
         # Skip validation if:
@@ -69,6 +177,70 @@ class DelegationService:
         # 2. delegator_id == principal_id (owner creating their own delegation)
         if delegator_id and delegator_id != principal_id:
             # Delegator is not the resource owner - check what permissions they have
+            requested_mask = _actions_mask(scope) if scope else _DEFAULT_SCOPE_MASK
+            delegator_mask = self._delegator_actions_mask(
+                principal_id, delegator_id, workflow_id, requested_mask
+            )
+
+            # Check if delegator is trying to delegate more than they have
+            if (requested_mask & delegator_mask) != requested_mask:
+                requested_actions = list(scope) if scope else list(_DEFAULT_SCOPE)
+                raise ValueError(
+                    f"Cannot delegate {requested_actions}. You only have {_actions_from_mask(delegator_mask)} permissions."
+                )
+
+        # Calculate expiration time: epoch arithmetic, one datetime built for formatting.
+        # Full-precision isoformat() is kept: graphdb compares expires_at as ISO strings.
+        expires_at_iso = datetime.fromtimestamp(
+            time.time() + expires_in_days * _SECONDS_PER_DAY, _UTC
+        ).isoformat()
+
+        # Insert delegation edge. The PostgreSQL backend returns (delegation_dict, was_created)
+        # and treats an identical delegation as idempotent; the other backends return the dict
+        # and raise ValueError on any duplicate, so a returned dict is always a new row.
+        #
+        # A new edge can complete chains that were cached as invalid (or too narrow), so the
+        # validation cache is dropped even if the write raises after it may have committed.
+        # The delegator permission cache is kept: inserts only add or widen edges, so a
+        # cached positive mask stays a safe lower bound (and a miss re-walks the graph).
+        try:
+            insert_result = self.graphdb.insert_edge(
+                principal_id=principal_id,
+                delegate_id=delegate_id,
+                workflow_id=workflow_id,
+                expires_at=expires_at_iso,
+                scope=scope,
+            )
+        finally:
+            self._invalidate_validation_cache()
+        if isinstance(insert_result, tuple):
+            delegation, was_created = insert_result
+        else:
+            delegation, was_created = insert_result, True
+
+        # Add metadata about whether it was newly created
+        delegation["was_created"] = was_created
+
+        return delegation
+
+    def _delegator_actions_mask(
+        self,
+        principal_id: str,
+        delegator_id: str,
+        workflow_id: str | None,
+        requested_mask: int,
+    ) -> int:
+        # Bitmask of the actions delegator_id holds on principal_id's behalf.
+        #
+        # Fast path: a recent positive validation already covers requested_mask.
+        # A miss, or a cached mask that does not cover it, falls through to the graph walk
+        # (permissions may have grown since), so the cache can never wrongly reject.
+        #
+        # Raises:
+        #     ValueError: If there is no delegation path from principal to delegator
+        cache_key = (principal_id, delegator_id, workflow_id)
+        delegator_mask = self._delegator_actions_cache.get(cache_key)
+        if delegator_mask is None or (requested_mask & delegator_mask) != requested_mask:
             delegator_validation = self.validate_delegation(
                 principal_id=principal_id,
                 delegate_id=delegator_id,
@@ -78,32 +250,92 @@ class DelegationService:
             if not delegator_validation.get("valid"):
                 raise ValueError("You cannot delegate permissions you don't have")
 
-            delegator_actions = set(delegator_validation.get("delegated_actions", []))
-            requested_actions = set(scope) if scope else {"execute"}
+            delegator_mask = _actions_mask(delegator_validation.get("delegated_actions", ()))
+            self._delegator_actions_cache.set(cache_key, delegator_mask)
+        return delegator_mask
 
-            # Check if delegator is trying to delegate more than they have
-            if not requested_actions.issubset(delegator_actions):
+    def create_delegations_bulk(
+        self,
+        requests: list[dict[str, Any]],
+        delegator_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        # Create several delegations on behalf of one delegator.
+        #
+        # Everything that can be checked without writing is checked for the whole batch
+        # before the first insert: per-item arguments (ids, principal != delegate,
+        # expires_in_days, scope), duplicate items, and the delegator's permissions. The
+        # latter are resolved once per (principal_id, workflow_id) group, for the union of
+        # the scopes requested in that group. An invalid batch is rejected without writes.
+        # Each insert then runs through create_delegation, whose delegator check is served
+        # from the permission cache.
+        #
+        # Args:
+        #     requests: create_delegation keyword arguments (principal_id, delegate_id,
+        #               and optionally workflow_id, expires_in_days, scope), one per delegation
+        #     delegator_id: ID of the authenticated user creating these delegations (from JWT)
+        #
+        # Returns:
+        #     List of delegation dictionaries, in request order
+        #
+        # Raises:
+        #     ValueError: Prefixed with "delegations[i]:" for the offending item; if a store
+        #                 write fails mid-batch the message also says how many were created
+        items: list[dict[str, Any]] = []
+        item_keys: set[tuple[str, str, str | None]] = set()
+        requested_by_group: dict[tuple[str, str | None], int] = {}
+        for index, request in enumerate(requests):
+            item = {
+                "principal_id": request.get("principal_id"),
+                "delegate_id": request.get("delegate_id"),
+                "workflow_id": request.get("workflow_id"),
+                "expires_in_days": request.get("expires_in_days", 7),
+                "scope": request.get("scope"),
+            }
+            try:
+                item["principal_id"], item["delegate_id"] = _validate_create_args(
+                    item["principal_id"], item["delegate_id"], item["expires_in_days"], item["scope"]
+                )
+            except ValueError as e:
+                raise ValueError(f"delegations[{index}]: {e}") from e
+
+            item_key = (item["principal_id"], item["delegate_id"], item["workflow_id"])
+            if item_key in item_keys:
                 raise ValueError(
-                    f"Cannot delegate {list(requested_actions)}. You only have {list(delegator_actions)} permissions."
+                    f"delegations[{index}]: duplicate delegation from '{item_key[0]}' to "
+                    f"'{item_key[1]}' in the same batch"
                 )
+            item_keys.add(item_key)
+            items.append(item)
 
-        # Calculate expiration time
-        expires_at = datetime.now(timezone.utc) + timedelta(days=expires_in_days)
-        expires_at_iso = expires_at.isoformat()
+            if delegator_id and item["principal_id"] != delegator_id:
+                group_key = (item["principal_id"], item["workflow_id"])
+                scope = item["scope"]
+                requested_by_group[group_key] = requested_by_group.get(group_key, 0) | (
+                    _actions_mask(scope) if scope else _DEFAULT_SCOPE_MASK
+                )
 
-        # Insert delegation edge (returns tuple: delegation_dict, was_created)
-        delegation, was_created = self.graphdb.insert_edge(
-            principal_id=principal_id,
-            delegate_id=delegate_id,
-            workflow_id=workflow_id,
-            expires_at=expires_at_iso,
-            scope=scope,
-        )
-        
-        # Add metadata about whether it was newly created
-        delegation["was_created"] = was_created
+        for (principal_id, workflow_id), requested_mask in requested_by_group.items():
+            delegator_mask = self._delegator_actions_mask(
+                principal_id, delegator_id, workflow_id, requested_mask
+            )
+            if (requested_mask & delegator_mask) != requested_mask:
+                raise ValueError(
+                    f"Cannot delegate {_actions_from_mask(requested_mask)} on behalf of {principal_id}. "
+                    f"You only have {_actions_from_mask(delegator_mask)} permissions."
+                )
 
-        return delegation
+        delegations: list[dict[str, Any]] = []
+        for index, item in enumerate(items):
+            try:
+                delegations.append(self.create_delegation(**item, delegator_id=delegator_id))
+            except ValueError as e:
+                # Store-level conflicts (e.g. an existing delegation) only surface on write.
+                # Earlier items that matched an existing delegation wrote nothing.
+                created = sum(1 for delegation in delegations if delegation["was_created"])
+                raise ValueError(
+                    f"delegations[{index}]: {e} ({created} earlier delegation(s) in this batch were created)"
+                ) from e
+        return delegations
 
     def revoke_delegation(
         self,
@@ -120,14 +352,20 @@ class DelegationService:
         #
         # Returns:
         #     Dictionary with revocation status
-        principal_id = require_non_empty_string(principal_id, "principal_id")
-        delegate_id = require_non_empty_string(delegate_id, "delegate_id")
+        principal_id = _normalize_id(principal_id, "principal_id")
+        delegate_id = _normalize_id(delegate_id, "delegate_id")
 
-        revoked = self.graphdb.revoke_edge(
-            principal_id=principal_id,
-            delegate_id=delegate_id,
-            workflow_id=workflow_id,
-        )
+        # A revoked edge can shorten any chain through it: drop both caches, also when the
+        # write raises after it may have committed
+        try:
+            revoked = self.graphdb.revoke_edge(
+                principal_id=principal_id,
+                delegate_id=delegate_id,
+                workflow_id=workflow_id,
+            )
+        finally:
+            self._delegator_actions_cache.clear()
+            self._invalidate_validation_cache()
 
         if not revoked:
             raise ValueError("Delegation not found or already revoked")
@@ -157,14 +395,14 @@ class DelegationService:
         # Returns:
         #     List of delegation dictionaries
         if principal_id:
-            principal_id = require_non_empty_string(principal_id, "principal_id")
+            principal_id = _normalize_id(principal_id, "principal_id")
             return self.graphdb.list_outgoing_edges(
                 principal_id=principal_id,
                 workflow_id=workflow_id,
                 include_expired=include_expired,
             )
         elif delegate_id:
-            delegate_id = require_non_empty_string(delegate_id, "delegate_id")
+            delegate_id = _normalize_id(delegate_id, "delegate_id")
             return self.graphdb.list_incoming_edges(
                 delegate_id=delegate_id,
                 workflow_id=workflow_id,
@@ -192,16 +430,20 @@ class DelegationService:
         #                it's valid for a specific action - use delegated_actions for that)
         #       - delegation_chain: list of user IDs in the delegation path
         #       - delegated_actions: list of actions available through this delegation
-        principal_id = require_non_empty_string(principal_id, "principal_id")
-        delegate_id = require_non_empty_string(delegate_id, "delegate_id")
+        principal_id = _normalize_id(principal_id, "principal_id")
+        delegate_id = _normalize_id(delegate_id, "delegate_id")
 
         # Direct match: delegate is the principal
         if delegate_id == principal_id:
-            return {
-                "valid": True,
-                "delegation_chain": [principal_id],
-                "delegated_actions": list(DELEGATION_ALLOWED_ACTIONS),
-            }
+            return _direct_match_result(principal_id)
+
+        # Repeated reads of the same tuple are served from the cache (results are shared:
+        # callers must not mutate them)
+        cache_key = (principal_id, delegate_id, workflow_id)
+        if self._validation_cache is not None:
+            cached = self._validation_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         # Find delegation path with action computation
         path_result = self.graphdb.find_delegation_path(
@@ -211,14 +453,18 @@ class DelegationService:
         )
 
         if path_result:
-            return {
+            result = {
                 "valid": True,
                 "delegation_chain": path_result["path"],
                 "delegated_actions": path_result["delegated_actions"],
             }
         else:
-            return {
+            result = {
                 "valid": False,
                 "delegation_chain": [],
                 "delegated_actions": [],
             }
+
+        if self._validation_cache is not None:
+            self._validation_cache.set(cache_key, result)
+        return result
@@ -35,6 +35,11 @@
 #         scope (optional, defaults applied)
 #         expires_at (optional, ISO-8601 UTC)
 #
+#   POST /v1/delegations/batch
+#     - Creates several delegations in one request ({"delegations": [...]},
+#       each item shaped like the POST /v1/delegations body)
+#     - Delegator permissions are checked once per principal/workflow group
+#
 #   GET /v1/delegations/{delegation_id}
 #     - Retrieves a single delegation record by id
 #
@@ -127,21 +132,24 @@ from __future__ import annotations
 
 import argparse
 import os
+import re
 from typing import Any, Dict, List, Optional
 
 import api_logging
 import security
 import uvicorn
-from delegation_core import DelegationService
+from delegation_core import DELEGATION_ALLOWED_ACTIONS, DelegationService
 from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from graphdb import DelegationGraphDB
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from utils import (
+    ORJSON_AVAILABLE,
     coerce_positive_int,
     load_json_object,
     merge_config,
+    read_env_int,
     require_non_empty_string,
 )
 
@@ -149,25 +157,27 @@ from utils import (
 # Configuration Constants
 # ============================================================================
 
+# Serialize responses with orjson when installed (falls back to stdlib json)
+JSON_RESPONSE_CLASS = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
 # Environment flag for detailed error messages (disable in production)
 INCLUDE_ERROR_DETAILS = os.environ.get("INCLUDE_ERROR_DETAILS", "1") == "1"
 
 # Delegation expiry configuration (can be overridden via environment variables)
-DELEGATION_DEFAULT_EXPIRY_DAYS = int(
-    os.environ.get("DELEGATION_DEFAULT_EXPIRY_DAYS", "7")
-)
-DELEGATION_MIN_EXPIRY_DAYS = int(os.environ.get("DELEGATION_MIN_EXPIRY_DAYS", "1"))
-DELEGATION_MAX_EXPIRY_DAYS = int(os.environ.get("DELEGATION_MAX_EXPIRY_DAYS", "365"))
+DELEGATION_DEFAULT_EXPIRY_DAYS = read_env_int("DELEGATION_DEFAULT_EXPIRY_DAYS", 7)
+DELEGATION_MIN_EXPIRY_DAYS = read_env_int("DELEGATION_MIN_EXPIRY_DAYS", 1)
+DELEGATION_MAX_EXPIRY_DAYS = read_env_int("DELEGATION_MAX_EXPIRY_DAYS", 365)
 
-# Delegation allowed actions (can be overridden via environment variables)
-_DELEGATION_ALLOWED_ACTIONS_STR = os.environ.get(
-    "DELEGATION_ALLOWED_ACTIONS", "read,execute"
-)
-DELEGATION_ALLOWED_ACTIONS = {
-    action.strip()
-    for action in _DELEGATION_ALLOWED_ACTIONS_STR.split(",")
-    if action.strip()
-}
+# Maximum number of delegations in one POST /v1/delegations/batch request
+DELEGATION_BATCH_MAX_SIZE = read_env_int("DELEGATION_BATCH_MAX_SIZE", 100)
+
+# Delegation allowed actions: parsed once in delegation_core (DELEGATION_ALLOWED_ACTIONS
+# environment variable) and imported here so scope validation cannot diverge from it.
+
+# Ids made only of these characters pass security.sanitize_string unchanged: no control
+# characters, and none of the payload signatures can match without whitespace, ':', '=',
+# '<', ';', '|' or path separators
+_SAFE_ID_RE = re.compile(r"[A-Za-z0-9_.@-]{1,255}\Z")
 
 # Default configuration values
 DEFAULT_CONFIG: dict[str, Any] = {
@@ -182,7 +192,21 @@ DEFAULT_CONFIG: dict[str, Any] = {
 # ============================================================================
 
 
+def sanitize_id(value: str | None) -> str | None:
+    # Sanitize an id field, skipping security.sanitize_string for plain ids (UUIDs,
+    # emails, w_... workflow ids) that it would return unchanged anyway.
+    if value is None:
+        return None
+    if _SAFE_ID_RE.match(value):
+        return value
+    return security.sanitize_string(value, 255)
+
+
 class CreateDelegationRequest(BaseModel):
+    # Strip surrounding whitespace in pydantic-core (native code) before the length
+    # constraints and the Python sanitizer run
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     principal_id: str = Field(
         ...,
         min_length=1,
@@ -209,34 +233,42 @@ class CreateDelegationRequest(BaseModel):
         description=f"Days until expiration (default: {DELEGATION_DEFAULT_EXPIRY_DAYS}, min: {DELEGATION_MIN_EXPIRY_DAYS}, max: {DELEGATION_MAX_EXPIRY_DAYS})",
     )
 
-    @validator("principal_id")
-    def sanitize_principal_id(cls, v: str) -> str:
-        return security.sanitize_string(v, 255)
-
-    @validator("delegate_id")
-    def sanitize_delegate_id(cls, v: str) -> str:
-        return security.sanitize_string(v, 255)
+    @field_validator("principal_id", "delegate_id", "workflow_id")
+    @classmethod
+    def sanitize_id_fields(cls, v: str | None) -> str | None:
+        return sanitize_id(v)
 
-    @validator("workflow_id")
-    def sanitize_workflow_id(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        return security.sanitize_string(v, 255)
-
-    @validator("scope")
+    @field_validator("scope")
+    @classmethod
     def validate_scope(cls, v: list[str] | None) -> list[str] | None:
-        if v is None:
+        # None and [] both mean "default scope": normalize to None without any set work,
+        # so the service and graph store never see an empty scope list
+        if not v:
             return None
-        # Validate that scope contains only allowed actions
-        for action in v:
-            if action not in DELEGATION_ALLOWED_ACTIONS:
-                raise ValueError(
-                    f"Invalid action in scope: {action}. Allowed: {DELEGATION_ALLOWED_ACTIONS}"
-                )
+        # Validate that scope contains only allowed actions (one C-level subset check;
+        # the error message is only built on rejection)
+        if not DELEGATION_ALLOWED_ACTIONS.issuperset(v):
+            invalid_actions = sorted(set(v).difference(DELEGATION_ALLOWED_ACTIONS))
+            raise ValueError(
+                f"Invalid action in scope: {', '.join(invalid_actions)}. Allowed: {sorted(DELEGATION_ALLOWED_ACTIONS)}"
+            )
         return v
 
 
+class CreateDelegationsBatchRequest(BaseModel):
+    delegations: list[CreateDelegationRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=DELEGATION_BATCH_MAX_SIZE,
+        description=f"Delegations to create (1 to {DELEGATION_BATCH_MAX_SIZE})",
+    )
+
+
 class RevokeDelegationRequest(BaseModel):
+    # Strip surrounding whitespace in pydantic-core (native code) before the length
+    # constraints and the Python sanitizer run
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     principal_id: str = Field(
         ..., min_length=1, max_length=255, description="Principal ID"
     )
@@ -247,19 +279,10 @@ class RevokeDelegationRequest(BaseModel):
         None, max_length=255, description="Optional workflow ID to scope revocation"
     )
 
-    @validator("principal_id")
-    def sanitize_principal_id(cls, v: str) -> str:
-        return security.sanitize_string(v, 255)
-
-    @validator("delegate_id")
-    def sanitize_delegate_id(cls, v: str) -> str:
-        return security.sanitize_string(v, 255)
-
-    @validator("workflow_id")
-    def sanitize_workflow_id(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        return security.sanitize_string(v, 255)
+    @field_validator("principal_id", "delegate_id", "workflow_id")
+    @classmethod
+    def sanitize_id_fields(cls, v: str | None) -> str | None:
+        return sanitize_id(v)
 
 
 def build_config(config_path: str | None) -> dict[str, Any]:
@@ -284,13 +307,22 @@ def build_config(config_path: str | None) -> dict[str, Any]:
 
 
 def handle_get_health(request: Request) -> dict[str, Any]:
-    # Return an operational health response.
-    return {
-        "status": "ok",
-        "service": str(
-            request.app.state.config.get("service_name", "flowpilot-delegation-api")
-        ),
-    }
+    # Return an operational health response (built once in create_app; probed constantly).
+    return request.app.state.health_body
+
+
+def get_effective_delegator_id(token_claims: dict[str, Any]) -> str | None:
+    # Extract delegator_id from JWT to validate they can only delegate what they have.
+    # Returns None (skip validation) when:
+    #   1. Token is from a service account (persona=service) acting on behalf of owner
+    #   2. No delegator_id provided
+    # Owner self-delegation (delegator_id == principal_id) is skipped per delegation.
+    # token_claims comes from security.verify_token, which always returns a claims dict
+    # (or raises 401), so no None/empty guard is needed.
+    # Check if this is a service account token (Cloud Run identity token has persona=service)
+    if token_claims.get("persona") == "service":
+        return None
+    return token_claims.get("sub") or None
 
 
 def handle_post_delegations(
@@ -306,26 +338,10 @@ def handle_post_delegations(
 
     try:
 
-        # Extract delegator_id from JWT to validate they can only delegate what they have
-        # Skip validation in these cases:
-        #   1. delegator_id matches principal_id (owner creating their own delegation)
-        #   2. Token is from a service account (persona=service) acting on behalf of owner
-        #   3. No delegator_id provided
-        delegator_id = token_claims.get("sub") if token_claims else None
-        persona = token_claims.get("persona") if token_claims else None
-
-        # Check if this is a service account token (Cloud Run identity token has persona=service)
-        is_service_account = persona == "service"
-
-        # Only validate subdelegations (non-service-account, non-owner delegations)
-        effective_delegator_id = None
-        if (
-            delegator_id
-            and delegator_id != body.principal_id
-            and not is_service_account
-        ):
-            # This is a subdelegation - validate that delegator has permissions
-            effective_delegator_id = delegator_id
+        # Only validate subdelegations: service accounts are filtered here; the owner case
+        # (delegator_id == principal_id) is skipped by create_delegation's own check, which
+        # tests the cheap None case before comparing strings
+        effective_delegator_id = get_effective_delegator_id(token_claims)
 
         delegation = service.create_delegation(
             principal_id=body.principal_id,
@@ -353,6 +369,51 @@ def handle_post_delegations(
         raise HTTPException(status_code=500, detail=error_detail) from exception
 
 
+def handle_post_delegations_batch(
+    request: Request,
+    response: Response,
+    body: CreateDelegationsBatchRequest,
+    token_claims: dict = Depends(security.verify_token),
+) -> dict[str, Any]:
+    # Create several delegations in one request.
+    # Delegator permissions are checked once per (principal, workflow) group up front.
+    # Returns 201 if any delegation was created, 200 if all already existed.
+    service: DelegationService = request.app.state.service
+
+    try:
+        delegations = service.create_delegations_bulk(
+            requests=[
+                {
+                    "principal_id": item.principal_id,
+                    "delegate_id": item.delegate_id,
+                    "workflow_id": item.workflow_id,
+                    "expires_in_days": item.expires_in_days,
+                    "scope": item.scope,
+                }
+                for item in body.delegations
+            ],
+            delegator_id=get_effective_delegator_id(token_claims),
+        )
+
+        any_created = False
+        for delegation in delegations:
+            if delegation.pop("was_created", True):  # Remove internal metadata
+                any_created = True
+        response.status_code = 201 if any_created else 200
+
+        return {"delegations": delegations}
+    except ValueError as exception:
+        error_detail = security.sanitize_error_message(
+            str(exception), INCLUDE_ERROR_DETAILS
+        )
+        raise HTTPException(status_code=400, detail=error_detail) from exception
+    except Exception as exception:
+        error_detail = security.sanitize_error_message(
+            str(exception), INCLUDE_ERROR_DETAILS
+        )
+        raise HTTPException(status_code=500, detail=error_detail) from exception
+
+
 def handle_delete_delegations(
     request: Request,
     body: RevokeDelegationRequest,
@@ -458,8 +519,13 @@ def create_app(config: dict[str, Any]) -> FastAPI:
         title="FlowPilot Delegation API",
         version="1.0.0",
         swagger_ui_parameters={"defaultModelsExpandDepth": -1},
+        default_response_class=JSON_RESPONSE_CLASS,
     )
     api.state.config = config
+    api.state.health_body = {
+        "status": "ok",
+        "service": str(config.get("service_name", "flowpilot-delegation-api")),
+    }
 
     # Initialize PostgreSQL graph database
     graphdb = DelegationGraphDB()  # Uses env vars for connection
@@ -479,7 +545,7 @@ def create_app(config: dict[str, Any]) -> FastAPI:
                 f"[HTTPException 401] Path: {request.url.path}, Detail: {exc.detail}, Auth header: {token_preview}",
                 flush=True,
             )
-        return JSONResponse(
+        return JSON_RESPONSE_CLASS(
             status_code=exc.status_code,
             content={"detail": exc.detail},
         )
@@ -503,30 +569,32 @@ def create_app(config: dict[str, Any]) -> FastAPI:
     # Health check - no auth required
     api.add_api_route("/health", handle_get_health, methods=["GET"])
 
-    # All other endpoints require authentication
+    # All other endpoints require authentication: each handler declares
+    # token_claims = Depends(security.verify_token), so no route-level dependency is added
     api.add_api_route(
         "/v1/delegations",
         handle_post_delegations,
         methods=["POST"],
-        dependencies=[Depends(security.verify_token)],
+    )
+    api.add_api_route(
+        "/v1/delegations/batch",
+        handle_post_delegations_batch,
+        methods=["POST"],
     )
     api.add_api_route(
         "/v1/delegations",
         handle_delete_delegations,
         methods=["DELETE"],
-        dependencies=[Depends(security.verify_token)],
     )
     api.add_api_route(
         "/v1/delegations",
         handle_get_delegations,
         methods=["GET"],
-        dependencies=[Depends(security.verify_token)],
     )
     api.add_api_route(
         "/v1/delegations/validate",
         handle_get_delegations_validate,
         methods=["GET"],
-        dependencies=[Depends(security.verify_token)],
     )
     # /v1/users endpoint moved to flowpilot-user-profile-api
 
@@ -567,6 +635,10 @@ def main() -> int:
     uvicorn_max_requests = int(os.environ.get("UVICORN_MAX_REQUESTS", "10000"))
     uvicorn_max_concurrency = int(os.environ.get("UVICORN_MAX_CONCURRENCY", "100"))
     uvicorn_keepalive_timeout = int(os.environ.get("UVICORN_KEEPALIVE_TIMEOUT", "5"))
+    # "auto" selects uvloop/httptools when installed (see requirements.txt) and falls
+    # back to asyncio/h11 otherwise (e.g. on Windows, where uvloop is unavailable)
+    uvicorn_loop = os.environ.get("UVICORN_LOOP", "auto")
+    uvicorn_http = os.environ.get("UVICORN_HTTP", "auto")
 
     uvicorn.run(
         api,
@@ -577,6 +649,8 @@ def main() -> int:
         limit_max_requests=uvicorn_max_requests,
         limit_concurrency=uvicorn_max_concurrency,
         timeout_keep_alive=uvicorn_keepalive_timeout,
+        loop=uvicorn_loop,  # Event loop implementation (uvloop when available)
+        http=uvicorn_http,  # HTTP protocol implementation (httptools when available)
     )
     return 0
 
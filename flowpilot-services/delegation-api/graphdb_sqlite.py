@@ -13,6 +13,7 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+import threading
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -34,14 +35,27 @@ class DelegationGraphDB:
             "db_path",
             os.environ.get("DB_PATH", "./delegations.db")
         )
+        # One long-lived connection per thread (sqlite3 connections are thread-bound).
+        # sqlite3 keeps a per-connection cache of prepared statements, so reusing the
+        # connection means the fixed queries below are parsed once, not on every call.
+        self._local = threading.local()
         self._init_schema()
 
     def _get_connection(self) -> sqlite3.Connection:
-        # Get a database connection.
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
+        # Get this thread's database connection, opening it on first use.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row  # Enable column access by name
+            self._local.conn = conn
         return conn
 
+    def _release_connection(self, conn: sqlite3.Connection) -> None:
+        # End an operation: discard any uncommitted changes (as closing the connection
+        # used to) but keep the connection and its statement cache for the next call.
+        if conn.in_transaction:
+            conn.rollback()
+
     def _init_schema(self) -> None:
         # Initialize the database schema.
         conn = self._get_connection()
@@ -91,7 +105,7 @@ class DelegationGraphDB:
             )
             conn.commit()
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     def insert_edge(
         self,
@@ -199,7 +213,7 @@ class DelegationGraphDB:
                 "revoked_at": row["revoked_at"],
             }
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     def revoke_edge(
         self,
@@ -231,7 +245,7 @@ class DelegationGraphDB:
             conn.commit()
             return cursor.rowcount > 0
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     def list_outgoing_edges(
         self,
@@ -295,7 +309,7 @@ class DelegationGraphDB:
 
             return result
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     def list_incoming_edges(
         self,
@@ -357,7 +371,7 @@ class DelegationGraphDB:
 
             return result
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     def find_delegation_path(
         self,
@@ -458,4 +472,4 @@ class DelegationGraphDB:
 
             return None
         finally:
-            conn.close()
+            self._release_connection(conn)
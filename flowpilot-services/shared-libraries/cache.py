@@ -261,7 +261,7 @@ def _determine_ttl(url: str) -> int:
 def http_get_json_with_cache(
     url: str,
     params: dict[str, str] | None = None,
-    timeout_seconds: int | None = None,
+    timeout_seconds: float | tuple[float, float] | None = None,
     headers: dict[str, str] | None = None,
     http_get_impl = None,  # The actual implementation function from utils
 ) -> dict[str, Any]:
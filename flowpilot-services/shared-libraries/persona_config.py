@@ -9,6 +9,9 @@ from typing import List, Dict, Any
 
 import yaml
 
+# Prefer the libyaml C loader (same safe semantics and YAMLError hierarchy); pure-Python fallback
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_persona_config_from_manifest(
     policy_name: str = "travel",
@@ -39,7 +42,7 @@ def load_persona_config_from_manifest(
     
     try:
         with open(manifest_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
     except yaml.YAMLError as e:
         raise ValueError(f"Failed to parse policy manifest {manifest_path}: {e}") from e
     
@@ -290,7 +293,7 @@ def load_full_manifest(
     
     try:
         with open(manifest_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
     except yaml.YAMLError as e:
         raise ValueError(f"Failed to parse policy manifest {manifest_path}: {e}") from e
     
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
@@ -24,6 +25,8 @@ from google.oauth2 import id_token
 from jose import JWTError
 from jose import jwt as jose_jwt
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from utils import TTLCache
 
 # Constants
 DEFAULT_MAX_REQUEST_SIZE_BYTES = 1_048_576  # 1 MB
@@ -47,27 +50,43 @@ class InputValidationError(ValueError):
 #
 
 
-class RequestSizeLimiterMiddleware(BaseHTTPMiddleware):
+class RequestSizeLimiterMiddleware:
     # Middleware to limit request body size.
     #
     # Protects against resource exhaustion attacks via large payloads.
-    def __init__(self, app, max_size: int = DEFAULT_MAX_REQUEST_SIZE_BYTES):
-        super().__init__(app)
+    #
+    # Pure ASGI (no BaseHTTPMiddleware task/stream wrapping) and never buffers the body:
+    # - With Content-Length: reject oversized requests before a single body byte is read.
+    # - Without it (chunked): count bytes as the app reads them and fail with 413 once the
+    #   running total exceeds max_size (HTTPException, so FastAPI's handlers render it).
+    def __init__(self, app: ASGIApp, max_size: int = DEFAULT_MAX_REQUEST_SIZE_BYTES):
+        self.app = app
         self.max_size = max_size
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        content_length = request.headers.get("content-length")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = None
+        for header_name, header_value in scope["headers"]:
+            if header_name == b"content-length":
+                content_length = header_value
+                break
+
         if content_length:
             try:
                 content_length_int = int(content_length)
             except ValueError:
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     content={"detail": "Invalid Content-Length header"},
                 )
+                await response(scope, receive, send)
+                return
 
             if content_length_int > self.max_size:
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                     content={
                         "detail": f"Request body too large. Maximum size: {self.max_size} bytes",
@@ -75,8 +94,29 @@ class RequestSizeLimiterMiddleware(BaseHTTPMiddleware):
                         "max_size_mb": round(self.max_size / 1_048_576, 2),
                     },
                 )
+                await response(scope, receive, send)
+                return
+
+            # Declared size is within limits: pass receive through untouched
+            await self.app(scope, receive, send)
+            return
 
-        return await call_next(request)
+        received_bytes = 0
+        max_size = self.max_size
+
+        async def receive_limited() -> Message:
+            nonlocal received_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                received_bytes += len(message.get("body", b""))
+                if received_bytes > max_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Request body too large. Maximum size: {max_size} bytes",
+                    )
+            return message
+
+        await self.app(scope, receive_limited, send)
 
 
 def get_max_request_size() -> int:
@@ -275,6 +315,25 @@ def sanitize_request_json_payload(payload: Any) -> Any:
     return payload
 
 
+def validate_request_json_payload(payload: Any) -> Any:
+    # Validate-only variant of sanitize_request_json_payload for read-only payloads:
+    # - Applies the same string checks to every string value (at any nesting depth).
+    # - Walks the payload iteratively and returns it unchanged, so the caller does not
+    #   pay for a recursive deep copy of the request on every call.
+    # - Callers must not mutate the returned payload in place (it is the request body).
+    max_len = get_max_string_length()
+    pending: list[Any] = [payload]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, str):
+            sanitize_string(value, max_len)
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+        elif isinstance(value, list):
+            pending.extend(value)
+    return payload
+
+
 def sanitize_error_message(message: str, include_details: bool = False) -> str:
     # Sanitize error messages to avoid leaking sensitive information.
     #
@@ -485,6 +544,48 @@ def _get_flowpilot_public_key() -> str:
 _http_bearer = HTTPBearer(auto_error=True)
 
 
+# Verified-token claims cache (keyed by SHA-256 of the raw token, never the token itself).
+# Entries never outlive the token's own exp claim.
+VERIFIED_TOKEN_CACHE_SIZE = int(os.environ.get("VERIFIED_TOKEN_CACHE_SIZE", "10000"))
+VERIFIED_TOKEN_CACHE_TTL_SECONDS = int(os.environ.get("VERIFIED_TOKEN_CACHE_TTL_SECONDS", "30"))
+
+_verified_token_cache = TTLCache(
+    maxsize=VERIFIED_TOKEN_CACHE_SIZE, ttl_seconds=VERIFIED_TOKEN_CACHE_TTL_SECONDS
+)
+
+
+def clear_verified_token_cache() -> None:
+    """Drop all cached token verifications (tests, key rotation)."""
+    _verified_token_cache.clear()
+
+
+def _verify_flowpilot_token_cached(token: str) -> dict[str, Any]:
+    """
+    Validate a FlowPilot access token, reusing claims from a recent successful validation.
+
+    Signature verification dominates per-request auth cost and the same bearer token is
+    presented many times within its lifetime. Failures are never cached, and a cached
+    entry expires at min(cache TTL, exp).
+    """
+    cache_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    cached_claims = _verified_token_cache.get(cache_key)
+    if cached_claims is not None:
+        exp = cached_claims.get("exp")
+        if not isinstance(exp, (int, float)) or exp > time.time():
+            return dict(cached_claims)
+        _verified_token_cache.pop(cache_key)
+
+    claims = verify_flowpilot_token(token)
+
+    ttl_seconds = float(VERIFIED_TOKEN_CACHE_TTL_SECONDS)
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl_seconds = min(ttl_seconds, exp - time.time())
+    if ttl_seconds > 0:
+        _verified_token_cache.set(cache_key, dict(claims), ttl_seconds=ttl_seconds)
+    return claims
+
+
 def verify_token(
     credentials: HTTPAuthorizationCredentials = Depends(_http_bearer),
 ) -> dict[str, Any]:
@@ -495,7 +596,19 @@ def verify_token(
     Use verify_firebase_token() for the token exchange endpoint specifically.
     """
     token = credentials.credentials
-    return verify_flowpilot_token(token)
+    return _verify_flowpilot_token_cached(token)
+
+
+def verify_bearer_token(
+    credentials: HTTPAuthorizationCredentials = Depends(_http_bearer),
+) -> tuple[dict[str, Any], str]:
+    """
+    FastAPI dependency: like verify_token, but also returns the raw bearer token.
+
+    For handlers that forward the caller's token downstream - one extraction site,
+    no manual Authorization header parsing.
+    """
+    return verify_token(credentials), credentials.credentials
 
 
 def verify_token_string(token: str) -> dict[str, Any]:
@@ -505,7 +618,7 @@ def verify_token_string(token: str) -> dict[str, Any]:
     This is used when you already have the token string (not from HTTPBearer dependency).
     Returns decoded claims if valid, raises HTTPException if invalid.
     """
-    return verify_flowpilot_token(token)
+    return _verify_flowpilot_token_cached(token)
 
 
 def verify_flowpilot_token(token: str) -> dict[str, Any]:
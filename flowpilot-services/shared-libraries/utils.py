@@ -13,12 +13,19 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from collections.abc import Mapping
+from functools import partial
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import api_logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Import cache module (optional - degrades gracefully if not available)
 try:
@@ -27,6 +34,13 @@ try:
 except ImportError:
     CACHE_AVAILABLE = False
 
+# Import orjson (optional - falls back to stdlib json if not available)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def read_env_string(name: str, default_value: str | None = None) -> str:
     # Read required environment variable as string.
@@ -121,6 +135,12 @@ HTTP_DEFAULT_TIMEOUT = read_env_float("HTTP_DEFAULT_TIMEOUT")
 HTTP_VERIFY_TLS = read_env_bool("HTTP_VERIFY_TLS")
 
 
+# Connection pool sizing for the shared HTTP session (optional environment variables)
+HTTP_POOL_CONNECTIONS = read_env_int("HTTP_POOL_CONNECTIONS", 32)
+HTTP_POOL_MAXSIZE = read_env_int("HTTP_POOL_MAXSIZE", 64)
+HTTP_MAX_RETRIES = read_env_int("HTTP_MAX_RETRIES", 2)
+
+
 def get_http_config() -> dict[str, Any]:
     # Return HTTP configuration dict compatible with requests library.
     # Usage: requests.get(url, **get_http_config())
@@ -130,6 +150,122 @@ def get_http_config() -> dict[str, Any]:
     }
 
 
+class HttpNon2xxError(RuntimeError):
+    # Raised by the http_* helpers when the upstream returns a non-2xx status.
+    #
+    # Carries the status code and full response body so callers can branch on
+    # them directly. str() keeps the historical "HTTP <METHOD> non-2xx: url=...
+    # http=... body=..." message for logs and callers that still match on text.
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        body: str,
+        headers: Mapping[str, str] | None = None,
+        body_bytes: bytes | None = None,
+    ) -> None:
+        self.method = method
+        self.url = url
+        self.status_code = int(status_code)
+        self.body = body
+        self.body_bytes = body.encode("utf-8") if body_bytes is None else body_bytes
+        self.headers = headers or {}
+        super().__init__(
+            f"HTTP {method} non-2xx: url={url} http={self.status_code} body={truncate_text(body, 800)}"
+        )
+
+
+def _build_http_session() -> requests.Session:
+    # Build the process-wide pooled HTTP session
+    # why: reuse keep-alive TCP/TLS connections instead of a fresh handshake per call
+    # assumptions: retries only cover idempotent methods (urllib3 default excludes POST)
+    #              and transient gateway errors; the final response is returned, not raised
+    # side effects: none until the first request is made.
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_HTTP_SESSION = _build_http_session()
+
+
+def get_http_session() -> requests.Session:
+    # Return the shared pooled HTTP session used by the http_* helpers.
+    return _HTTP_SESSION
+
+
+# ============================================================================
+# In-Process TTL Cache
+# ============================================================================
+
+
+class TTLCache:
+    # Bounded, thread-safe LRU cache with per-entry time-to-live.
+    #
+    # Used for short-lived memoization of idempotent lookups (PIP fetches, authz
+    # decisions, verified token claims) inside a single process. Entries expire
+    # after ttl_seconds and the least recently used entry is evicted once
+    # maxsize is reached. Values are returned as stored (callers must not mutate).
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be > 0 (got {maxsize})")
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be > 0 (got {ttl_seconds})")
+        self.maxsize = int(maxsize)
+        self.ttl_seconds = float(ttl_seconds)
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if now >= expires_at:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any, ttl_seconds: float | None = None) -> None:
+        expires_at = time.monotonic() + (
+            self.ttl_seconds if ttl_seconds is None else float(ttl_seconds)
+        )
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
 # ============================================================================
 # Value Coercion Functions
 # ============================================================================
@@ -437,6 +573,39 @@ def require_optional_string(value: Any, field_name: str) -> str | None:
     return stripped if stripped else None
 
 
+def json_dumps_bytes(value: Any) -> bytes:
+    # Serialize a JSON-compatible value to UTF-8 bytes (orjson when available).
+    # Values orjson rejects (e.g. integers beyond 64 bits) are encoded by stdlib json instead.
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_dumps_canonical_bytes(value: Any) -> bytes:
+    # Serialize with sorted keys so equal values always yield equal bytes (cache keys, hashes).
+    # Values orjson rejects (e.g. integers beyond 64 bits) are encoded by stdlib json instead;
+    # a given value always takes the same path, so its bytes stay stable.
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+    ).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> Any:
+    # Parse JSON from bytes or str (orjson when available).
+    # Raises ValueError on invalid JSON (orjson.JSONDecodeError subclasses it).
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def build_url(base_url: str, path: str) -> str:
     # Build a stable absolute URL from base URL + path to avoid double slashes and missing separators.
     base = base_url.rstrip("/") + "/"
@@ -466,7 +635,7 @@ def http_get_text(
     # Perform HTTP GET and return (status, text)
     # side effect: network I/O and raises on transport errors.
     try:
-        response = requests.get(
+        response = _HTTP_SESSION.get(
             url, headers=headers or {}, timeout=int(timeout_seconds)
         )
     except requests.RequestException as exception:
@@ -477,8 +646,9 @@ def http_get_text(
 def http_get_json(
     url: str,
     params: dict[str, str] | None = None,
-    timeout_seconds: int | None = None,
+    timeout_seconds: float | tuple[float, float] | None = None,
     headers: dict[str, str] | None = None,
+    session: requests.Session | None = None,
 ) -> dict[str, Any]:
     # Perform HTTP GET expecting JSON object with optional query parameters
     # Includes automatic request/response logging via api_logging
@@ -487,18 +657,27 @@ def http_get_json(
     # Args:
     #     url: Full URL to GET from
     #     params: Optional query parameters (e.g., {"key": "value"})
-    #     timeout_seconds: Optional timeout in seconds. If None, uses get_http_config() defaults
+    #     timeout_seconds: Optional timeout in seconds. If None, uses get_http_config() defaults.
+    #         A (connect, read) tuple from build_timeouts() is also accepted
     #     headers: Optional HTTP headers (e.g., {"Authorization": "Bearer token"})
+    #     session: Optional requests session; defaults to the shared pooled session
     #
     # Returns:
     #     Response body as dict
     #
     # Raises:
-    #     RuntimeError: On non-2xx status or invalid JSON response
+    #     HttpNon2xxError: On non-2xx status (subclass of RuntimeError)
+    #     RuntimeError: On invalid JSON response
     
     if url.strip() == "":
         raise ValueError("url must be non-empty")
-    
+
+    http_get_impl = (
+        _http_get_json_impl
+        if session is None
+        else partial(_http_get_json_impl, session=session)
+    )
+
     # Try cache first (if available and enabled)
     if CACHE_AVAILABLE:
         try:
@@ -507,7 +686,7 @@ def http_get_json(
                 params=params,
                 timeout_seconds=timeout_seconds,
                 headers=headers,
-                http_get_impl=_http_get_json_impl  # Pass through to actual implementation
+                http_get_impl=http_get_impl  # Pass through to actual implementation
             )
         except Exception as e:
             # Cache module had an error - fall back to direct call
@@ -519,14 +698,15 @@ def http_get_json(
             )
     
     # Cache not available or disabled - direct call
-    return _http_get_json_impl(url, params, timeout_seconds, headers)
+    return http_get_impl(url, params=params, timeout_seconds=timeout_seconds, headers=headers)
 
 
 def _http_get_json_impl(
     url: str,
     params: dict[str, str] | None = None,
-    timeout_seconds: int | None = None,
+    timeout_seconds: float | tuple[float, float] | None = None,
     headers: dict[str, str] | None = None,
+    session: requests.Session | None = None,
 ) -> dict[str, Any]:
     # Internal implementation of HTTP GET (called by http_get_json or cache layer)
     # This is the actual HTTP call logic, separated so cache can wrap it
@@ -544,9 +724,9 @@ def _http_get_json_impl(
         request_body=params,  # Log query params as request_body for visibility
     )
     
-    # Make request
+    # Make request over the pooled session (keep-alive connection reuse)
     try:
-        response = requests.get(
+        response = (session or _HTTP_SESSION).get(
             url,
             params=params or {},
             headers=headers or {},
@@ -569,12 +749,17 @@ def _http_get_json_impl(
             status_code=response.status_code,
             error=f"HTTP GET non-2xx: body={truncate_text(response.text, 800)}",
         )
-        raise RuntimeError(
-            f"HTTP GET non-2xx: url={url} http={response.status_code} body={truncate_text(response.text, 800)}"
+        raise HttpNon2xxError(
+            method="GET",
+            url=url,
+            status_code=response.status_code,
+            body=response.text,
+            headers=response.headers,
+            body_bytes=response.content,
         )
     
     try:
-        response_body = response.json()
+        response_body = json_loads(response.content)
     except ValueError as exc:
         # Log JSON parsing error
         api_logging.log_api_response(
@@ -603,6 +788,7 @@ def http_post_json(
     payload: dict,
     timeouts: tuple[float, float] | None = None,
     headers: dict[str, str] | None = None,
+    session: requests.Session | None = None,
 ) -> dict:
     # POST JSON and return JSON
     # why: centralize outbound HTTP with consistent timeouts, errors, and logging
@@ -614,12 +800,14 @@ def http_post_json(
     #     payload: JSON payload (dict)
     #     timeouts: Optional (connect, read) timeout tuple. If None, uses get_http_config() defaults
     #     headers: Optional HTTP headers (e.g., {"Authorization": "Bearer token"})
+    #     session: Optional requests session; defaults to the shared pooled session
     #
     # Returns:
     #     Response body as dict
     #
     # Raises:
-    #     RuntimeError: On non-2xx status or invalid JSON response
+    #     HttpNon2xxError: On non-2xx status (subclass of RuntimeError)
+    #     RuntimeError: On invalid JSON response
     if url.strip() == "":
         raise ValueError("url must be non-empty")
     
@@ -638,11 +826,16 @@ def http_post_json(
         request_body=payload,
     )
     
-    # Make request
-    response = requests.post(
+    # Serialize once with orjson (when available) and send the raw bytes
+    request_headers = {"Content-Type": "application/json"}
+    if headers:
+        request_headers.update(headers)
+
+    # Make request over the pooled session (keep-alive connection reuse)
+    response = (session or _HTTP_SESSION).post(
         url,
-        json=payload,
-        headers=headers or {},
+        data=json_dumps_bytes(payload),
+        headers=request_headers,
         **request_kwargs
     )
     
@@ -654,12 +847,17 @@ def http_post_json(
             status_code=response.status_code,
             error=f"HTTP POST non-2xx: body={truncate_text(response.text, 800)}",
         )
-        raise RuntimeError(
-            f"HTTP POST non-2xx: url={url} http={response.status_code} body={truncate_text(response.text, 800)}"
+        raise HttpNon2xxError(
+            method="POST",
+            url=url,
+            status_code=response.status_code,
+            body=response.text,
+            headers=response.headers,
+            body_bytes=response.content,
         )
     
     try:
-        response_body = response.json()
+        response_body = json_loads(response.content)
     except ValueError as exc:
         # Log JSON parsing error
         api_logging.log_api_response(
@@ -188,6 +188,10 @@ reasons[code] if {
   code := "validate_persona.persona_invalid"
 }
 
+# Single decision document for authz-api: allow + reasons from one rule evaluation,
+# so the client never has to fetch the whole package (and evaluate every helper rule)
+decision := {"allow": allow, "reasons": reasons}
+
 # Anti-spoofing and delegation check
 # 1. Owner directly (non-service-persona)
 # 2. Service persona (ai-agent, domain-services) activated by owner (context.principal == owner)
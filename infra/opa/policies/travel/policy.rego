@@ -195,6 +195,10 @@ reasons[code] if {
 }
 
 
+# Single decision document for authz-api: allow + reasons from one rule evaluation,
+# so the client never has to fetch the whole package (and evaluate every helper rule)
+decision := {"allow": allow, "reasons": reasons}
+
 # Anti-spoofing and delegation check
 # The principal must be authorized to perform the action:
 # 1. Principal is the owner (covers both direct access and owner using agent), OR